@@ -1,6 +1,7 @@
 import logging
 
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 
 from src.core.config import Config
 from src.crons import setup_cron_jobs
@@ -20,6 +21,7 @@ app = FastAPI(
         4. Notify recording oracle that raw annotations are ready
     """,
     version="0.1.0",
+    default_response_class=ORJSONResponse,
 )
 
 init_api(app)
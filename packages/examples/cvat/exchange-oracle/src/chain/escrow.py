@@ -33,7 +33,7 @@ def validate_escrow(
             )
         )
 
-    if status == Status.Pending and not allow_no_funds:
+    if status is Status.Pending and not allow_no_funds:
         if int(escrow.balance) == 0:
             raise ValueError("Escrow doesn't have funds")
 
@@ -1,4 +1,5 @@
 import json
+from functools import lru_cache
 from typing import Any
 
 from eth_account.messages import encode_defunct
@@ -10,38 +11,30 @@ from src.core.config import Config
 from src.core.types import Networks
 
 
+@lru_cache(maxsize=None)
 def get_web3(chain_id: Networks):
+    # Building a client derives the account from the private key and sets up
+    # middlewares, so one instance is kept per network and shared between calls.
+    # Unsupported chain ids raise, and exceptions are not cached
     match chain_id:
         case Config.polygon_mainnet.chain_id:
-            w3 = Web3(HTTPProvider(Config.polygon_mainnet.rpc_api))
-            gas_payer = w3.eth.account.from_key(Config.polygon_mainnet.private_key)
-            w3.middleware_onion.add(
-                construct_sign_and_send_raw_middleware(gas_payer),
-                "construct_sign_and_send_raw_middleware",
-            )
-            w3.eth.default_account = gas_payer.address
-            return w3
+            network_config = Config.polygon_mainnet
         case Config.polygon_mumbai.chain_id:
-            w3 = Web3(HTTPProvider(Config.polygon_mumbai.rpc_api))
-            gas_payer = w3.eth.account.from_key(Config.polygon_mumbai.private_key)
-            w3.middleware_onion.add(
-                construct_sign_and_send_raw_middleware(gas_payer),
-                "construct_sign_and_send_raw_middleware",
-            )
-            w3.eth.default_account = gas_payer.address
-            return w3
+            network_config = Config.polygon_mumbai
         case Config.localhost.chain_id:
-            w3 = Web3(HTTPProvider(Config.localhost.rpc_api))
-            gas_payer = w3.eth.account.from_key(Config.localhost.private_key)
-            w3.middleware_onion.add(
-                construct_sign_and_send_raw_middleware(gas_payer),
-                "construct_sign_and_send_raw_middleware",
-            )
-            w3.eth.default_account = gas_payer.address
-            return w3
+            network_config = Config.localhost
         case _:
             raise ValueError(f"{chain_id} is not in available list of networks.")
 
+    w3 = Web3(HTTPProvider(network_config.rpc_api))
+    gas_payer = w3.eth.account.from_key(network_config.private_key)
+    w3.middleware_onion.add(
+        construct_sign_and_send_raw_middleware(gas_payer),
+        "construct_sign_and_send_raw_middleware",
+    )
+    w3.eth.default_account = gas_payer.address
+    return w3
+
 
 def serialize_message(message: Any) -> str:
     return json.dumps(message, separators=(",", ":"))
@@ -76,7 +69,10 @@ def recover_signer(chain_id: Networks, message, signature: str) -> str:
     return signer
 
 
+@lru_cache(maxsize=4096)
 def validate_address(escrow_address: str) -> str:
+    # The same escrow address comes in many times during a task lifecycle,
+    # so the keccak-based checksum computation is cached
     if not Web3.is_address(escrow_address):
         raise ValueError(f"{escrow_address} is not a correct Web3 address")
     return Web3.to_checksum_address(escrow_address)
@@ -10,10 +10,21 @@ from src.utils.net import is_ipv4
 load_dotenv()
 
 
+_TRUE_VALUES = frozenset(("y", "yes", "t", "true", "on", "1"))
+_FALSE_VALUES = frozenset(("n", "no", "f", "false", "off", "0"))
+
+
 def str_to_bool(val: str) -> bool:
-    from distutils.util import strtobool
+    if val is True:
+        return True
 
-    return val is True or strtobool(val)
+    val = val.strip().lower()
+    if val in _TRUE_VALUES:
+        return True
+    elif val in _FALSE_VALUES:
+        return False
+    else:
+        raise ValueError(f"invalid truth value {val!r}")
 
 
 class PostgresConfig:
@@ -24,9 +35,11 @@ class PostgresConfig:
     database = os.environ.get("PG_DB", "exchange_oracle")
     lock_timeout = int(os.environ.get("PG_LOCK_TIMEOUT", "3000"))  # milliseconds
 
+    _connection_url = f"postgresql://{user}:{password}@{host}:{port}/{database}"
+
     @classmethod
     def connection_url(cls):
-        return f"postgresql://{cls.user}:{cls.password}@{cls.host}:{cls.port}/{cls.database}"
+        return cls._connection_url
 
 
 class PolygonMainnetConfig:
@@ -58,25 +71,27 @@ class LocalhostConfig:
 
 class CronConfig:
     process_job_launcher_webhooks_int = int(os.environ.get("PROCESS_JOB_LAUNCHER_WEBHOOKS_INT", 30))
-    process_job_launcher_webhooks_chunk_size = os.environ.get(
-        "PROCESS_JOB_LAUNCHER_WEBHOOKS_CHUNK_SIZE", 5
+    process_job_launcher_webhooks_chunk_size = int(
+        os.environ.get("PROCESS_JOB_LAUNCHER_WEBHOOKS_CHUNK_SIZE", 5)
     )
     process_recording_oracle_webhooks_int = int(
         os.environ.get("PROCESS_RECORDING_ORACLE_WEBHOOKS_INT", 30)
     )
-    process_recording_oracle_webhooks_chunk_size = os.environ.get(
-        "PROCESS_RECORDING_ORACLE_WEBHOOKS_CHUNK_SIZE", 5
+    process_recording_oracle_webhooks_chunk_size = int(
+        os.environ.get("PROCESS_RECORDING_ORACLE_WEBHOOKS_CHUNK_SIZE", 5)
     )
     track_completed_projects_int = int(os.environ.get("TRACK_COMPLETED_PROJECTS_INT", 30))
-    track_completed_projects_chunk_size = os.environ.get("TRACK_COMPLETED_PROJECTS_CHUNK_SIZE", 5)
+    track_completed_projects_chunk_size = int(
+        os.environ.get("TRACK_COMPLETED_PROJECTS_CHUNK_SIZE", 5)
+    )
     track_completed_tasks_int = int(os.environ.get("TRACK_COMPLETED_TASKS_INT", 30))
-    track_creating_tasks_chunk_size = os.environ.get("TRACK_CREATING_TASKS_CHUNK_SIZE", 5)
+    track_creating_tasks_chunk_size = int(os.environ.get("TRACK_CREATING_TASKS_CHUNK_SIZE", 5))
     track_creating_tasks_int = int(os.environ.get("TRACK_CREATING_TASKS_INT", 300))
     track_assignments_int = int(os.environ.get("TRACK_ASSIGNMENTS_INT", 5))
-    track_assignments_chunk_size = os.environ.get("TRACK_ASSIGNMENTS_CHUNK_SIZE", 10)
+    track_assignments_chunk_size = int(os.environ.get("TRACK_ASSIGNMENTS_CHUNK_SIZE", 10))
 
     retrieve_annotations_int = int(os.environ.get("RETRIEVE_ANNOTATIONS_INT", 60))
-    retrieve_annotations_chunk_size = os.environ.get("RETRIEVE_ANNOTATIONS_CHUNK_SIZE", 5)
+    retrieve_annotations_chunk_size = int(os.environ.get("RETRIEVE_ANNOTATIONS_CHUNK_SIZE", 5))
 
 
 class CvatConfig:
@@ -101,20 +116,13 @@ class StorageConfig:
     results_bucket_name = os.environ.get("STORAGE_RESULTS_BUCKET_NAME", "")
     secure = str_to_bool(os.environ.get("STORAGE_USE_SSL", "true"))
 
-    @classmethod
-    def provider_endpoint_url(cls):
-        scheme = "https://" if cls.secure else "http://"
-
-        return f"{scheme}{cls.endpoint_url}"
-
-    @classmethod
-    def bucket_url(cls):
-        scheme = "https://" if cls.secure else "http://"
-
-        if is_ipv4(cls.endpoint_url):
-            return f"{scheme}{cls.endpoint_url}/{cls.results_bucket_name}/"
-        else:
-            return f"{scheme}{cls.results_bucket_name}.{cls.endpoint_url}/"
+    # The values above are fixed at process start, so the derived urls are computed once
+    _scheme = "https://" if secure else "http://"
+    provider_endpoint_url = f"{_scheme}{endpoint_url}"
+    if is_ipv4(endpoint_url):
+        bucket_url = f"{_scheme}{endpoint_url}/{results_bucket_name}/"
+    else:
+        bucket_url = f"{_scheme}{results_bucket_name}.{endpoint_url}/"
 
 
 class FeaturesConfig:
@@ -144,6 +152,7 @@ class Config:
     polygon_mainnet = PolygonMainnetConfig
     polygon_mumbai = PolygonMumbaiConfig
     localhost = LocalhostConfig
+    supported_networks = (PolygonMainnetConfig, PolygonMumbaiConfig)
 
     postgres_config = PostgresConfig
     human_app_config = HumanAppConfig
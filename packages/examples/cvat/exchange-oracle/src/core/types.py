@@ -9,6 +9,11 @@ class Networks(int, Enum, metaclass=BetterEnumMeta):
     polygon_mumbai = Config.polygon_mumbai.chain_id
     localhost = Config.localhost.chain_id
 
+    @classmethod
+    def __get_validators__(cls):
+        # Lets pydantic resolve chain ids with a single lookup instead of the generic enum validator
+        yield cls.resolve
+
 
 class CvatEventTypes(str, Enum, metaclass=BetterEnumMeta):
     update_job = "update:job"
@@ -1,3 +1,4 @@
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List
 
 import src.cvat.api_calls as cvat_api
@@ -275,7 +276,7 @@ def retrieve_annotations() -> None:
                 annotation_files.append(annotation_metafile)
 
                 storage_client = cloud_client.S3Client(
-                    StorageConfig.provider_endpoint_url(),
+                    StorageConfig.provider_endpoint_url,
                     access_key=StorageConfig.access_key,
                     secret_key=StorageConfig.secret_key,
                 )
@@ -290,19 +291,26 @@ def retrieve_annotations() -> None:
                         ),
                     )
                 )
-                for file_descriptor in annotation_files:
-                    if file_descriptor.filename in existing_storage_files:
-                        continue
-
-                    storage_client.create_file(
-                        StorageConfig.results_bucket_name,
-                        compose_output_annotation_filename(
-                            project.escrow_address,
-                            project.chain_id,
-                            file_descriptor.filename,
-                        ),
-                        file_descriptor.file.read(),
-                    )
+                # The files are independent, so they are uploaded in parallel.
+                # create_file only uses the low-level boto3 client, which is thread-safe
+                # (unlike boto3 resources), so the upload threads share one storage client.
+                with ThreadPoolExecutor(max_workers=8) as executor:
+                    uploads = [
+                        executor.submit(
+                            storage_client.create_file,
+                            StorageConfig.results_bucket_name,
+                            compose_output_annotation_filename(
+                                project.escrow_address,
+                                project.chain_id,
+                                file_descriptor.filename,
+                            ),
+                            file_descriptor.file.read(),
+                        )
+                        for file_descriptor in annotation_files
+                        if file_descriptor.filename not in existing_storage_files
+                    ]
+                    for upload in uploads:
+                        upload.result()
 
                 oracle_db_service.outbox.create_webhook(
                     session,
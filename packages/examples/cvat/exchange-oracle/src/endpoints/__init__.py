@@ -1,5 +1,10 @@
 """ API endpoints """
-from fastapi import APIRouter, FastAPI
+import hashlib
+from email.utils import formatdate
+from http import HTTPStatus
+
+from fastapi import APIRouter, FastAPI, Request, Response
+from pydantic import BaseModel
 
 from src.core.config import Config
 from src.endpoints.cvat import router as cvat_router
@@ -9,41 +14,88 @@ from src.schemas import MetaResponse, ResponseError, ValidationErrorResponse
 
 greet_router = APIRouter()
 
+_NETWORKS_INFO = [
+    {
+        "chain_id": network.chain_id,
+        "addr": network.addr,
+    }
+    for network in Config.supported_networks
+]
+
+
+def _build_meta_response() -> MetaResponse:
+    # The payload is static and known to be valid, so validation is skipped
+    return MetaResponse.construct(
+        message="Exchange Oracle API",
+        version="0.1.0",
+        supported_networks=_NETWORKS_INFO,
+    )
+
+
+# The meta response only depends on the static config, so it is serialized once
+_META_JSON = _build_meta_response().json().encode()
+_META_ETAG = '"{}"'.format(hashlib.md5(_META_JSON).hexdigest())
+_META_HEADERS = {
+    "ETag": _META_ETAG,
+    "Last-Modified": formatdate(usegmt=True),
+    "Cache-Control": "public, max-age=300",
+}
+
 
 @greet_router.get("/", description="Endpoint describing the API", response_model=MetaResponse)
-def meta_route() -> MetaResponse:
-    networks = [Config.polygon_mainnet, Config.polygon_mumbai]
+def meta_route(request: Request) -> Response:
+    if request.headers.get("if-none-match") == _META_ETAG:
+        return Response(status_code=HTTPStatus.NOT_MODIFIED, headers=_META_HEADERS)
+
+    return Response(content=_META_JSON, media_type="application/json", headers=_META_HEADERS)
 
-    networks_info = [
-        {
-            "chain_id": network.chain_id,
-            "addr": network.addr,
+
+def _schema_ref_response(model: type[BaseModel]) -> dict:
+    return {
+        "content": {
+            "application/json": {"schema": {"$ref": f"#/components/schemas/{model.__name__}"}}
         }
-        for network in networks
-    ]
-
-    return MetaResponse.parse_obj(
-        dict(
-            message="Exchange Oracle API",
-            version="0.1.0",
-            supported_networks=networks_info,
-        )
-    )
+    }
+
+
+# The error responses reference shared schema components instead of models,
+# so FastAPI doesn't create response fields for them on every included route
+_DEFAULT_RESPONSE_MODELS = (ValidationErrorResponse, ResponseError)
+_DEFAULT_RESPONSES = {
+    400: _schema_ref_response(ValidationErrorResponse),
+    404: _schema_ref_response(ResponseError),
+    405: _schema_ref_response(ResponseError),
+    422: _schema_ref_response(ResponseError),
+    500: _schema_ref_response(ResponseError),
+}
+
+
+def _setup_openapi_components(app: FastAPI) -> None:
+    default_openapi = app.openapi
+
+    def openapi() -> dict:
+        if app.openapi_schema:
+            return app.openapi_schema
+
+        openapi_schema = default_openapi()
+        schemas = openapi_schema.setdefault("components", {}).setdefault("schemas", {})
+        for model in _DEFAULT_RESPONSE_MODELS:
+            model_schema = model.schema(ref_template="#/components/schemas/{model}")
+            schemas.update(model_schema.pop("definitions", {}))
+            schemas[model.__name__] = model_schema
+
+        return openapi_schema
+
+    app.openapi = openapi
 
 
 def init_api(app: FastAPI) -> FastAPI:
     """Register API endpoints"""
-    default_responses = {
-        400: {"model": ValidationErrorResponse},
-        404: {"model": ResponseError},
-        405: {"model": ResponseError},
-        422: {"model": ResponseError},
-        500: {"model": ResponseError},
-    }
+    _setup_openapi_components(app)
 
     app.include_router(greet_router)
-    app.include_router(cvat_router, responses=default_responses)
-    app.include_router(webhook_router, responses=default_responses)
-    app.include_router(service_router, responses=default_responses)
+    app.include_router(cvat_router, responses=_DEFAULT_RESPONSES)
+    app.include_router(webhook_router, responses=_DEFAULT_RESPONSES)
+    app.include_router(service_router, responses=_DEFAULT_RESPONSES)
 
     return app
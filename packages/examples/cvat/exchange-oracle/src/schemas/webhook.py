@@ -1,23 +1,28 @@
 from datetime import datetime
 from typing import Optional
 
-from pydantic import BaseModel, validator
+from pydantic import BaseModel
 
 from src.chain.web3 import validate_address
 from src.core.types import JobLauncherEventType, Networks
 
 
+class EscrowAddress(str):
+    """Web3 address, normalized to the checksum form during parsing"""
+
+    @classmethod
+    def __get_validators__(cls):
+        # A plain single-argument validator avoids the per-call dispatch of @validator methods
+        yield validate_address
+
+
 class OracleWebhook(BaseModel):
-    escrow_address: str
+    escrow_address: EscrowAddress
     chain_id: Networks
     event_type: str
     event_data: Optional[dict] = None
     timestamp: Optional[datetime] = None  # TODO: remove optional
 
-    @validator("escrow_address", allow_reuse=True)
-    def validate_escrow_(cls, value):
-        return validate_address(value)
-
     # pylint: disable=too-few-public-methods
     class Config:
         schema_extra = {
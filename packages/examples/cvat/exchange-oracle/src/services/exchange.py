@@ -1,10 +1,12 @@
 from datetime import timedelta
+from functools import lru_cache
 from typing import Optional
 
 import src.cvat.api_calls as cvat_api
 import src.models.cvat as models
 import src.services.cvat as cvat_service
 from src.chain.escrow import get_escrow_manifest
+from src.core.manifest import TaskManifest
 from src.core.types import AssignmentStatus, JobStatuses, PlatformType, ProjectStatuses
 from src.db import SessionLocal
 from src.schemas import exchange as service_api
@@ -13,6 +15,13 @@ from src.utils.requests import get_or_404
 from src.utils.time import utcnow
 
 
+@lru_cache(maxsize=1024)
+def _get_task_manifest(chain_id: int, escrow_address: str) -> TaskManifest:
+    # The manifest can't change once the escrow is set up,
+    # so it is downloaded and parsed only once per escrow
+    return parse_manifest(get_escrow_manifest(chain_id, escrow_address))
+
+
 def serialize_task(
     project_id: str, *, assignment_id: Optional[str] = None
 ) -> service_api.TaskResponse:
@@ -23,7 +32,7 @@ def serialize_task(
         if assignment_id:
             assignment = cvat_service.get_assignments_by_id(session, [assignment_id])[0]
 
-        manifest = parse_manifest(get_escrow_manifest(project.chain_id, project.escrow_address))
+        manifest = _get_task_manifest(project.chain_id, project.escrow_address)
 
         serialized_assignment = None
         if assignment:
@@ -124,7 +133,7 @@ def create_assignment(project_id: int, wallet_address: str) -> Optional[str]:
             )
             return None
 
-        manifest = parse_manifest(get_escrow_manifest(project.chain_id, project.escrow_address))
+        manifest = _get_task_manifest(project.chain_id, project.escrow_address)
 
         unassigned_job: Optional[models.Job] = None
         unfinished_assignments: list[models.Assignment] = []
@@ -6,5 +6,39 @@ class BetterEnumMeta(EnumMeta):
     Extends the default enum metaclass with extra methods for better usability
     """
 
+    def __new__(metacls, cls, bases, classdict, **kwargs):
+        enum_class = super().__new__(metacls, cls, bases, classdict, **kwargs)
+
+        # Lets string membership misses be rejected without hashing the value
+        str_value_lengths = [
+            len(v) for v in enum_class._value2member_map_ if isinstance(v, str)
+        ] or [0]
+        enum_class._min_value_len = min(str_value_lengths)
+        enum_class._max_value_len = max(str_value_lengths)
+
+        return enum_class
+
+    def resolve(cls, value):
+        """
+        Returns the member with the given value using a single lookup in the value table
+        """
+        member = cls._value2member_map_.get(value)
+        if member is None:
+            permitted = ", ".join(repr(v) for v in cls._value2member_map_)
+            raise ValueError(f"value is not a valid enumeration member; permitted: {permitted}")
+
+        return member
+
     def __contains__(cls, item):
-        return isinstance(item, cls) or item in [v.value for v in cls.__members__.values()]
+        if isinstance(item, cls):
+            return True
+
+        if isinstance(item, str) and not (cls._min_value_len <= len(item) <= cls._max_value_len):
+            return False
+
+        # Use the value lookup table built by EnumMeta instead of scanning the members
+        try:
+            return item in cls._value2member_map_
+        except TypeError:
+            # unhashable values can't be enum values
+            return False
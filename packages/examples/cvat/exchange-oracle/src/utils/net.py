@@ -1,10 +1,18 @@
 import ipaddress
+import re
+
+_IPV4_CANDIDATE_PATTERN = re.compile(r"\d{1,3}(?:\.\d{1,3}){3}")
 
 
 def is_ipv4(addr: str, allow_port: bool = True) -> bool:
+    if allow_port:
+        addr = addr.split(":", maxsplit=1)[0]
+
+    # Most of the checked values are host names, they are rejected without raising an exception
+    if not _IPV4_CANDIDATE_PATTERN.fullmatch(addr):
+        return False
+
     try:
-        if allow_port:
-            addr = addr.split(":", maxsplit=1)[0]
         ipaddress.IPv4Address(addr)
         return True
     except ValueError:
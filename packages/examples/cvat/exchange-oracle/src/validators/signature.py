@@ -1,9 +1,11 @@
+import asyncio
 import hmac
 from ast import literal_eval
 from hashlib import sha256
 from http import HTTPStatus
 
 from fastapi import HTTPException, Request
+from starlette.concurrency import run_in_threadpool
 
 from src.chain.escrow import get_job_launcher_address, get_recording_oracle_address
 from src.chain.web3 import recover_signer
@@ -18,11 +20,12 @@ async def validate_oracle_webhook_signature(
     data: bytes = await request.body()
     message: dict = literal_eval(data.decode("utf-8"))
 
-    signer = recover_signer(webhook.chain_id, message, signature)
-
-    job_launcher_address = get_job_launcher_address(webhook.chain_id, webhook.escrow_address)
-    recording_oracle_address = get_recording_oracle_address(
-        webhook.chain_id, webhook.escrow_address
+    # The signer recovery and the escrow reads are blocking rpc calls,
+    # so they are run concurrently outside of the event loop
+    signer, job_launcher_address, recording_oracle_address = await asyncio.gather(
+        run_in_threadpool(recover_signer, webhook.chain_id, message, signature),
+        run_in_threadpool(get_job_launcher_address, webhook.chain_id, webhook.escrow_address),
+        run_in_threadpool(get_recording_oracle_address, webhook.chain_id, webhook.escrow_address),
     )
     possible_signers = {
         OracleWebhookTypes.job_launcher: job_launcher_address,
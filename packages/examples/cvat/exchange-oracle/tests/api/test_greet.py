@@ -4,3 +4,12 @@ from fastapi.testclient import TestClient
 def test_greet_route(client: TestClient) -> None:
     response = client.get(f"/")
     assert response.status_code == 200
+
+
+def test_greet_route_not_modified(client: TestClient) -> None:
+    response = client.get("/")
+    etag = response.headers["etag"]
+
+    response = client.get("/", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.headers["etag"] == etag
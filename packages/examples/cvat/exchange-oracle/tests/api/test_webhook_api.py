@@ -14,7 +14,7 @@ from tests.utils.constants import RECORDING_ORACLE_ADDRESS, WEBHOOK_MESSAGE, WEB
 escrow_address = "0x12E66A452f95bff49eD5a30b0d06Ebc37C5A94B6"
 
 
-def test_incoming_webhook_200(client: TestClient) -> None:
+def test_incoming_webhook_202(client: TestClient) -> None:
     with (
         SessionLocal.begin() as session,
         patch("src.chain.web3.get_web3") as mock_get_web3,
@@ -32,7 +32,7 @@ def test_incoming_webhook_200(client: TestClient) -> None:
             json=WEBHOOK_MESSAGE,
         )
 
-        assert response.status_code == 200
+        assert response.status_code == 202
 
         db_query = select(Webhook).where(Webhook.escrow_address == escrow_address)
         webhook = session.execute(db_query).scalars().first()
@@ -54,6 +54,11 @@ class ServiceIntegrationTest(unittest.TestCase):
         self.assertEqual(w3.eth.default_account, DEFAULT_GAS_PAYER)
         self.assertEqual(w3.manager._provider.endpoint_uri, LocalhostConfig.rpc_api)
 
+    def test_get_web3_cached(self):
+        w3 = get_web3(ChainId.LOCALHOST.value)
+        self.assertIs(get_web3(ChainId.LOCALHOST.value), w3)
+        self.assertIsNone(w3.middleware_onion.get("geth_poa"))
+
     def test_get_web3_invalid_chain_id(self):
         with self.assertRaises(ValueError) as error:
             w3 = get_web3(1234)
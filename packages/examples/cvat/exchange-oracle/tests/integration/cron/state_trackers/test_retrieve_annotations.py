@@ -18,6 +18,8 @@ from src.db import SessionLocal
 from src.models.cvat import Assignment, Job, Project, Task, User
 from src.models.webhook import Webhook
 
+ESCROW_ADDRESS = "0x86e83d346041E8806e352681f3F14549C0d2BC67"
+
 
 class ServiceIntegrationTest(unittest.TestCase):
     def setUp(self):
@@ -26,9 +28,8 @@ class ServiceIntegrationTest(unittest.TestCase):
     def tearDown(self):
         self.session.close()
 
-    def test_retrieve_annotations(self):
+    def _create_completed_project(self) -> str:
         cvat_project_id = 1
-        escrow_address = "0x86e83d346041E8806e352681f3F14549C0d2BC67"
         project_id = str(uuid.uuid4())
         cvat_project = Project(
             id=project_id,
@@ -36,7 +37,7 @@ class ServiceIntegrationTest(unittest.TestCase):
             cvat_cloudstorage_id=1,
             status=ProjectStatuses.completed.value,
             job_type=TaskType.image_label_binary.value,
-            escrow_address=escrow_address,
+            escrow_address=ESCROW_ADDRESS,
             chain_id=Networks.localhost.value,
             bucket_url="https://test.storage.googleapis.com/",
         )
@@ -83,6 +84,11 @@ class ServiceIntegrationTest(unittest.TestCase):
         self.session.add(assignment)
         self.session.commit()
 
+        return project_id
+
+    def test_retrieve_annotations(self):
+        project_id = self._create_completed_project()
+
         with (
             open("tests/utils/manifest.json") as data,
             patch("src.crons.state_trackers.get_escrow_manifest") as mock_get_manifest,
@@ -99,7 +105,7 @@ class ServiceIntegrationTest(unittest.TestCase):
 
         webhook = (
             self.session.query(Webhook)
-            .filter_by(escrow_address=escrow_address, chain_id=Networks.localhost.value)
+            .filter_by(escrow_address=ESCROW_ADDRESS, chain_id=Networks.localhost.value)
             .first()
         )
         self.assertIsNotNone(webhook)
@@ -110,7 +116,6 @@ class ServiceIntegrationTest(unittest.TestCase):
 
     def test_retrieve_annotations_unfinished_jobs(self):
         cvat_project_id = 1
-        escrow_address = "0x86e83d346041E8806e352681f3F14549C0d2BC67"
         project_id = str(uuid.uuid4())
         cvat_project = Project(
             id=project_id,
@@ -118,7 +123,7 @@ class ServiceIntegrationTest(unittest.TestCase):
             cvat_cloudstorage_id=1,
             status=ProjectStatuses.completed.value,
             job_type=TaskType.image_label_binary.value,
-            escrow_address=escrow_address,
+            escrow_address=ESCROW_ADDRESS,
             chain_id=Networks.localhost.value,
             bucket_url="https://test.storage.googleapis.com/",
         )
@@ -152,61 +157,7 @@ class ServiceIntegrationTest(unittest.TestCase):
 
     @patch("src.cvat.api_calls.get_job_annotations")
     def test_retrieve_annotations_error_getting_annotations(self, mock_annotations):
-        cvat_project_id = 1
-        escrow_address = "0x86e83d346041E8806e352681f3F14549C0d2BC67"
-        project_id = str(uuid.uuid4())
-        cvat_project = Project(
-            id=project_id,
-            cvat_id=cvat_project_id,
-            cvat_cloudstorage_id=1,
-            status=ProjectStatuses.completed.value,
-            job_type=TaskType.image_label_binary.value,
-            escrow_address=escrow_address,
-            chain_id=Networks.localhost.value,
-            bucket_url="https://test.storage.googleapis.com/",
-        )
-        self.session.add(cvat_project)
-
-        cvat_task_id = 1
-        cvat_task = Task(
-            id=str(uuid.uuid4()),
-            cvat_id=cvat_task_id,
-            cvat_project_id=cvat_project_id,
-            status=TaskStatus.completed.value,
-        )
-        self.session.add(cvat_task)
-
-        cvat_job = Job(
-            id=str(uuid.uuid4()),
-            cvat_id=1,
-            cvat_project_id=cvat_project_id,
-            cvat_task_id=cvat_task_id,
-            status=JobStatuses.completed,
-        )
-        self.session.add(cvat_job)
-        wallet_address = "0x86e83d346041E8806e352681f3F14549C0d2BC67"
-        user = User(
-            wallet_address=wallet_address,
-            cvat_email="test@hmt.ai",
-            cvat_id=1,
-        )
-        self.session.add(user)
-
-        wallet_address_2 = "0x86e83d346041E8806e352681f3F14549C0d2BC68"
-        user = User(
-            wallet_address=wallet_address_2,
-            cvat_email="test2@hmt.ai",
-            cvat_id=2,
-        )
-        self.session.add(user)
-        assignment = Assignment(
-            id=str(uuid.uuid4()),
-            user_wallet_address=wallet_address,
-            cvat_job_id=cvat_job.cvat_id,
-            expires_at=datetime.now() + timedelta(days=1),
-        )
-        self.session.add(assignment)
-        self.session.commit()
+        project_id = self._create_completed_project()
 
         with (
             open("tests/utils/manifest.json") as data,
@@ -226,7 +177,7 @@ class ServiceIntegrationTest(unittest.TestCase):
 
         webhook = (
             self.session.query(Webhook)
-            .filter_by(escrow_address=escrow_address, chain_id=Networks.localhost.value)
+            .filter_by(escrow_address=ESCROW_ADDRESS, chain_id=Networks.localhost.value)
             .first()
         )
         self.assertIsNone(webhook)
@@ -236,76 +187,52 @@ class ServiceIntegrationTest(unittest.TestCase):
         self.assertEqual(db_project.status, ProjectStatuses.completed.value)
 
     def test_retrieve_annotations_error_uploading_files(self):
-        cvat_project_id = 1
-        escrow_address = "0x86e83d346041E8806e352681f3F14549C0d2BC67"
-        project_id = str(uuid.uuid4())
-        cvat_project = Project(
-            id=project_id,
-            cvat_id=cvat_project_id,
-            cvat_cloudstorage_id=1,
-            status=ProjectStatuses.completed.value,
-            job_type=TaskType.image_label_binary.value,
-            escrow_address=escrow_address,
-            chain_id=Networks.localhost.value,
-            bucket_url="https://test.storage.googleapis.com/",
-        )
-        self.session.add(cvat_project)
+        project_id = self._create_completed_project()
 
-        cvat_task_id = 1
-        cvat_task = Task(
-            id=str(uuid.uuid4()),
-            cvat_id=cvat_task_id,
-            cvat_project_id=cvat_project_id,
-            status=TaskStatus.completed.value,
-        )
-        self.session.add(cvat_task)
+        with (
+            open("tests/utils/manifest.json") as data,
+            patch("src.crons.state_trackers.get_escrow_manifest") as mock_get_manifest,
+            patch("src.crons.state_trackers.cvat_api"),
+            patch("src.crons.state_trackers.validate_escrow"),
+        ):
+            manifest = json.load(data)
+            mock_get_manifest.return_value = manifest
 
-        cvat_job = Job(
-            id=str(uuid.uuid4()),
-            cvat_id=1,
-            cvat_project_id=cvat_project_id,
-            cvat_task_id=cvat_task_id,
-            status=JobStatuses.completed,
-        )
-        self.session.add(cvat_job)
-        wallet_address = "0x86e83d346041E8806e352681f3F14549C0d2BC67"
-        user = User(
-            wallet_address=wallet_address,
-            cvat_email="test@hmt.ai",
-            cvat_id=1,
-        )
-        self.session.add(user)
+            retrieve_annotations()
 
-        wallet_address_2 = "0x86e83d346041E8806e352681f3F14549C0d2BC68"
-        user = User(
-            wallet_address=wallet_address_2,
-            cvat_email="test2@hmt.ai",
-            cvat_id=2,
-        )
-        self.session.add(user)
-        assignment = Assignment(
-            id=str(uuid.uuid4()),
-            user_wallet_address=wallet_address,
-            cvat_job_id=cvat_job.cvat_id,
-            expires_at=datetime.now() + timedelta(days=1),
+        webhook = (
+            self.session.query(Webhook)
+            .filter_by(escrow_address=ESCROW_ADDRESS, chain_id=Networks.localhost.value)
+            .first()
         )
-        self.session.add(assignment)
-        self.session.commit()
+        self.assertIsNone(webhook)
+
+        db_project = self.session.query(Project).filter_by(id=project_id).first()
+
+        self.assertEqual(db_project.status, ProjectStatuses.completed.value)
+
+    def test_retrieve_annotations_error_in_parallel_upload(self):
+        project_id = self._create_completed_project()
 
         with (
             open("tests/utils/manifest.json") as data,
             patch("src.crons.state_trackers.get_escrow_manifest") as mock_get_manifest,
             patch("src.crons.state_trackers.cvat_api"),
             patch("src.crons.state_trackers.validate_escrow"),
+            patch("src.crons.state_trackers.cloud_client.S3Client") as mock_S3Client,
         ):
             manifest = json.load(data)
             mock_get_manifest.return_value = manifest
+            mock_S3Client.return_value.list_files.return_value = []
+            mock_create_file = Mock(side_effect=[None, Exception("Upload failed")] + [None] * 8)
+            mock_S3Client.return_value.create_file = mock_create_file
 
             retrieve_annotations()
 
+        self.assertGreater(mock_create_file.call_count, 1)
         webhook = (
             self.session.query(Webhook)
-            .filter_by(escrow_address=escrow_address, chain_id=Networks.localhost.value)
+            .filter_by(escrow_address=ESCROW_ADDRESS, chain_id=Networks.localhost.value)
             .first()
         )
         self.assertIsNone(webhook)
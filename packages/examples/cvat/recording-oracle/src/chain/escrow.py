@@ -1,4 +1,5 @@
 import json
+from functools import lru_cache
 from typing import List
 
 from human_protocol_sdk.constants import ChainId, Status
@@ -35,15 +36,25 @@ def validate_escrow(
             )
         )
 
-    if status == Status.Pending and not allow_no_funds:
+    if status is Status.Pending and not allow_no_funds:
         if int(escrow.balance) == 0:
             raise ValueError("Escrow doesn't have funds")
 
 
+@lru_cache(maxsize=256)
+def _download_manifest(manifest_url: str, manifest_hash: str) -> bytes:
+    # A manifest can't change once the escrow is set up,
+    # so the content is cached by its url and hash
+    return StorageUtils.download_file_from_url(manifest_url)
+
+
 def get_escrow_manifest(chain_id: int, escrow_address: str) -> dict:
     escrow = get_escrow(chain_id, escrow_address)
 
-    manifest_content = StorageUtils.download_file_from_url(escrow.manifest_url)
+    if escrow.manifest_hash:
+        manifest_content = _download_manifest(escrow.manifest_url, escrow.manifest_hash)
+    else:
+        manifest_content = StorageUtils.download_file_from_url(escrow.manifest_url)
 
     return json.loads(manifest_content.decode("utf-8"))
 
@@ -10,10 +10,21 @@ from src.utils.net import is_ipv4
 load_dotenv()
 
 
+_TRUE_VALUES = frozenset(("y", "yes", "t", "true", "on", "1"))
+_FALSE_VALUES = frozenset(("n", "no", "f", "false", "off", "0"))
+
+
 def str_to_bool(val: str) -> bool:
-    from distutils.util import strtobool
+    if val is True:
+        return True
 
-    return val is True or strtobool(val)
+    val = val.strip().lower()
+    if val in _TRUE_VALUES:
+        return True
+    elif val in _FALSE_VALUES:
+        return False
+    else:
+        raise ValueError(f"invalid truth value {val!r}")
 
 
 class Postgres:
@@ -24,9 +35,11 @@ class Postgres:
     database = os.environ.get("PG_DB", "recording_oracle")
     lock_timeout = int(os.environ.get("PG_LOCK_TIMEOUT", "3000"))  # milliseconds
 
+    _connection_url = f"postgresql://{user}:{password}@{host}:{port}/{database}"
+
     @classmethod
     def connection_url(cls):
-        return f"postgresql://{cls.user}:{cls.password}@{cls.host}:{cls.port}/{cls.database}"
+        return cls._connection_url
 
 
 class PolygonMainnetConfig:
@@ -60,18 +73,35 @@ class CronConfig:
     process_exchange_oracle_webhooks_int = int(
         os.environ.get("PROCESS_EXCHANGE_ORACLE_WEBHOOKS_INT", 3000)
     )
-    process_exchange_oracle_webhooks_chunk_size = os.environ.get(
-        "PROCESS_EXCHANGE_ORACLE_WEBHOOKS_CHUNK_SIZE", 5
+    process_exchange_oracle_webhooks_chunk_size = int(
+        os.environ.get("PROCESS_EXCHANGE_ORACLE_WEBHOOKS_CHUNK_SIZE", 5)
     )
     process_reputation_oracle_webhooks_int = int(
         os.environ.get("PROCESS_REPUTATION_ORACLE_WEBHOOKS_INT", 3000)
     )
-    process_reputation_oracle_webhooks_chunk_size = os.environ.get(
-        "PROCESS_REPUTATION_ORACLE_WEBHOOKS_CHUNK_SIZE", 5
+    process_reputation_oracle_webhooks_chunk_size = int(
+        os.environ.get("PROCESS_REPUTATION_ORACLE_WEBHOOKS_CHUNK_SIZE", 5)
     )
 
 
-class StorageConfig:
+class _BucketConfig:
+    endpoint_url: str
+    results_bucket_name: str
+    secure: bool
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+
+        # The values are fixed at process start, so the derived urls are computed once
+        scheme = "https://" if cls.secure else "http://"
+        cls.provider_endpoint_url = f"{scheme}{cls.endpoint_url}"
+        if is_ipv4(cls.endpoint_url):
+            cls.bucket_url = f"{scheme}{cls.endpoint_url}/{cls.results_bucket_name}/"
+        else:
+            cls.bucket_url = f"{scheme}{cls.results_bucket_name}.{cls.endpoint_url}/"
+
+
+class StorageConfig(_BucketConfig):
     endpoint_url = os.environ.get("STORAGE_ENDPOINT_URL", "storage.googleapis.com")
     region = os.environ.get("STORAGE_REGION", "")
     access_key = os.environ.get("STORAGE_ACCESS_KEY", "")
@@ -79,23 +109,8 @@ class StorageConfig:
     results_bucket_name = os.environ.get("STORAGE_RESULTS_BUCKET_NAME", "")
     secure = str_to_bool(os.environ.get("STORAGE_USE_SSL", "true"))
 
-    @classmethod
-    def provider_endpoint_url(cls):
-        scheme = "https://" if cls.secure else "http://"
-
-        return f"{scheme}{cls.endpoint_url}"
-
-    @classmethod
-    def bucket_url(cls):
-        scheme = "https://" if cls.secure else "http://"
-
-        if is_ipv4(cls.endpoint_url):
-            return f"{scheme}{cls.endpoint_url}/{cls.results_bucket_name}/"
-        else:
-            return f"{scheme}{cls.results_bucket_name}.{cls.endpoint_url}/"
-
 
-class ExchangeOracleStorageConfig:
+class ExchangeOracleStorageConfig(_BucketConfig):
     endpoint_url = os.environ.get("EXCHANGE_ORACLE_STORAGE_ENDPOINT_URL", "storage.googleapis.com")
     region = os.environ.get("EXCHANGE_ORACLE_STORAGE_REGION", "")
     access_key = os.environ.get("EXCHANGE_ORACLE_STORAGE_ACCESS_KEY", "")
@@ -103,21 +118,6 @@ class ExchangeOracleStorageConfig:
     results_bucket_name = os.environ.get("EXCHANGE_ORACLE_STORAGE_RESULTS_BUCKET_NAME", "")
     secure = str_to_bool(os.environ.get("EXCHANGE_ORACLE_STORAGE_USE_SSL", "true"))
 
-    @classmethod
-    def provider_endpoint_url(cls):
-        scheme = "https://" if cls.secure else "http://"
-
-        return f"{scheme}{cls.endpoint_url}"
-
-    @classmethod
-    def bucket_url(cls):
-        scheme = "https://" if cls.secure else "http://"
-
-        if is_ipv4(cls.endpoint_url):
-            return f"{scheme}{cls.endpoint_url}/{cls.results_bucket_name}/"
-        else:
-            return f"{scheme}{cls.results_bucket_name}.{cls.endpoint_url}/"
-
 
 class FeaturesConfig:
     enable_custom_cloud_host = str_to_bool(os.environ.get("ENABLE_CUSTOM_CLOUD_HOST", "no"))
@@ -139,6 +139,7 @@ class Config:
     polygon_mainnet = PolygonMainnetConfig
     polygon_mumbai = PolygonMumbaiConfig
     localhost = LocalhostConfig
+    supported_networks = (PolygonMainnetConfig, PolygonMumbaiConfig)
 
     postgres_config = Postgres
     cron_config = CronConfig
@@ -4,11 +4,16 @@ from src.core.config import Config
 from src.utils.enums import BetterEnumMeta
 
 
-class Networks(int, Enum):
+class Networks(int, Enum, metaclass=BetterEnumMeta):
     polygon_mainnet = Config.polygon_mainnet.chain_id
     polygon_mumbai = Config.polygon_mumbai.chain_id
     localhost = Config.localhost.chain_id
 
+    @classmethod
+    def __get_validators__(cls):
+        # Lets pydantic resolve chain ids with a single lookup instead of the generic enum validator
+        yield cls.resolve
+
 
 class TaskType(str, Enum, metaclass=BetterEnumMeta):
     image_label_binary = "IMAGE_LABEL_BINARY"
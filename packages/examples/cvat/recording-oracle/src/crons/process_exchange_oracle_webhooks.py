@@ -1,6 +1,7 @@
 import io
 import logging
 import os
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict
 
 import httpx
@@ -93,7 +94,7 @@ def handle_exchange_oracle_event(webhook: Webhook, *, db_session: Session, logge
                 escrow.get_escrow_manifest(webhook.chain_id, webhook.escrow_address)
             )
 
-            excor_bucket_host = Config.exchange_oracle_storage_config.provider_endpoint_url()
+            excor_bucket_host = Config.exchange_oracle_storage_config.provider_endpoint_url
             excor_bucket_name = Config.exchange_oracle_storage_config.results_bucket_name
 
             excor_annotation_meta_path = compose_bucket_filename(
@@ -168,29 +169,41 @@ def handle_exchange_oracle_event(webhook: Webhook, *, db_session: Session, logge
                 validation_metafile = serialize_validation_meta(validation_results.validation_meta)
 
                 storage_client = cloud_client.S3Client(
-                    Config.storage_config.provider_endpoint_url(),
+                    Config.storage_config.provider_endpoint_url,
                     access_key=Config.storage_config.access_key,
                     secret_key=Config.storage_config.secret_key,
                 )
 
+                # The uploads are independent, so they run concurrently with each other
+                # and with hashing. The results are stored on chain only after both succeed.
                 # TODO: add encryption
-                storage_client.create_file(
-                    Config.storage_config.results_bucket_name,
-                    recor_merged_annotations_path,
-                    validation_results.resulting_annotations,
-                )
-                storage_client.create_file(
-                    Config.storage_config.results_bucket_name,
-                    recor_validation_meta_path,
-                    validation_metafile,
-                )
+                with ThreadPoolExecutor(max_workers=2) as executor:
+                    uploads = [
+                        executor.submit(
+                            storage_client.create_file,
+                            Config.storage_config.results_bucket_name,
+                            recor_merged_annotations_path,
+                            validation_results.resulting_annotations,
+                        ),
+                        executor.submit(
+                            storage_client.create_file,
+                            Config.storage_config.results_bucket_name,
+                            recor_validation_meta_path,
+                            validation_metafile,
+                        ),
+                    ]
+                    resulting_annotations_hash = compute_resulting_annotations_hash(
+                        validation_results.resulting_annotations
+                    )
+                    for upload in uploads:
+                        upload.result()
 
                 escrow.store_results(
                     webhook.chain_id,
                     webhook.escrow_address,
-                    Config.storage_config.bucket_url()
+                    Config.storage_config.bucket_url
                     + os.path.dirname(recor_merged_annotations_path),
-                    compute_resulting_annotations_hash(validation_results.resulting_annotations),
+                    resulting_annotations_hash,
                 )
 
                 oracle_db_service.outbox.create_webhook(
@@ -1,9 +1,13 @@
+from http import HTTPStatus
 from typing import Union
 
 from fastapi import APIRouter, Header, HTTPException, Request
+from fastapi.responses import ORJSONResponse
+from starlette.concurrency import run_in_threadpool
 
 import src.services.webhook as oracle_db_service
 from src.chain.escrow import validate_escrow
+from src.core.types import OracleWebhookTypes
 from src.db import SessionLocal
 from src.schemas.webhook import OracleWebhook, OracleWebhookResponse
 from src.validators.signature import validate_oracle_webhook_signature
@@ -11,27 +15,44 @@ from src.validators.signature import validate_oracle_webhook_signature
 router = APIRouter()
 
 
-@router.post("/oracle-webhook", description="Receives a webhook from an oracle")
+def _store_incoming_webhook(
+    webhook: OracleWebhook, sender_type: OracleWebhookTypes, signature: str
+) -> str:
+    with SessionLocal.begin() as session:
+        return oracle_db_service.inbox.create_webhook(
+            session=session,
+            escrow_address=webhook.escrow_address,
+            chain_id=webhook.chain_id,
+            type=sender_type,
+            signature=signature,
+            event_type=webhook.event_type,
+            event_data=webhook.event_data,
+        )
+
+
+@router.post(
+    "/oracle-webhook",
+    description="Receives a webhook from an oracle",
+    response_model=OracleWebhookResponse,
+    status_code=HTTPStatus.ACCEPTED,
+)
 async def receive_oracle_webhook(
     webhook: OracleWebhook,
     request: Request,
     human_signature: Union[str, None] = Header(default=None),
-) -> OracleWebhookResponse:
+) -> ORJSONResponse:
     try:
         sender = await validate_oracle_webhook_signature(request, human_signature, webhook)
-        validate_escrow(webhook.chain_id, webhook.escrow_address)
-
-        with SessionLocal.begin() as session:
-            webhook_id = oracle_db_service.inbox.create_webhook(
-                session=session,
-                escrow_address=webhook.escrow_address,
-                chain_id=webhook.chain_id,
-                type=sender,
-                signature=human_signature,
-                event_type=webhook.event_type,
-                event_data=webhook.event_data,
-            )
-
-        return OracleWebhookResponse(id=webhook_id)
+        await run_in_threadpool(validate_escrow, webhook.chain_id, webhook.escrow_address)
+
+        # The inbox table is the queue: the webhook is only persisted here and is
+        # processed later by the inbox cron jobs, so the request is acknowledged as accepted.
+        # The blocking db call is moved out of the event loop to keep accepting requests.
+        webhook_id = await run_in_threadpool(
+            _store_incoming_webhook, webhook, sender, human_signature
+        )
+
+        # The ack is returned as is, the response model is only used for the docs
+        return ORJSONResponse({"id": webhook_id}, status_code=HTTPStatus.ACCEPTED)
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
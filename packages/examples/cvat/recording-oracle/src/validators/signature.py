@@ -1,7 +1,9 @@
+import asyncio
 from ast import literal_eval
 from http import HTTPStatus
 
 from fastapi import HTTPException, Request
+from starlette.concurrency import run_in_threadpool
 
 from src.chain.escrow import get_exchange_oracle_address
 from src.chain.web3 import recover_signer
@@ -15,9 +17,12 @@ async def validate_oracle_webhook_signature(
     data: bytes = await request.body()
     message: dict = literal_eval(data.decode("utf-8"))
 
-    signer = recover_signer(webhook.chain_id, message, signature)
-
-    exchange_oracle_address = get_exchange_oracle_address(webhook.chain_id, webhook.escrow_address)
+    # The signer recovery and the escrow read are blocking rpc calls,
+    # so they are run concurrently outside of the event loop
+    signer, exchange_oracle_address = await asyncio.gather(
+        run_in_threadpool(recover_signer, webhook.chain_id, message, signature),
+        run_in_threadpool(get_exchange_oracle_address, webhook.chain_id, webhook.escrow_address),
+    )
     possible_signers = {
         OracleWebhookTypes.exchange_oracle: exchange_oracle_address,
     }
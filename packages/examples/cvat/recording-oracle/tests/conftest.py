@@ -4,6 +4,8 @@ import pytest
 from fastapi.testclient import TestClient
 
 from src import app
+from src.chain.escrow import _download_manifest
+from src.chain.web3 import get_web3
 from src.db import Base, engine
 
 
@@ -13,6 +15,16 @@ def db():
     Base.metadata.create_all(bind=engine)
 
 
+@pytest.fixture(autouse=True)
+def manifest_cache():
+    _download_manifest.cache_clear()
+
+
+@pytest.fixture(autouse=True)
+def web3_cache():
+    get_web3.cache_clear()
+
+
 @pytest.fixture(scope="module")
 def client() -> Generator:
     with TestClient(app) as c:
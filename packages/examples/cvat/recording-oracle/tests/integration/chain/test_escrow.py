@@ -103,6 +103,24 @@ class ServiceIntegrationTest(unittest.TestCase):
             self.assertIsInstance(manifest, dict)
             self.assertIsNotNone(manifest)
 
+    def test_get_escrow_manifest_cached(self):
+        with patch("src.chain.escrow.get_escrow") as mock_get_escrow, patch(
+            "src.chain.escrow.StorageUtils.download_file_from_url"
+        ) as mock_download:
+            mock_download.return_value = json.dumps({"title": "test"}).encode()
+
+            mock_escrow = self.escrow()
+            mock_escrow.manifest_hash = DEFAULT_HASH
+            mock_get_escrow.return_value = mock_escrow
+            manifest = get_escrow_manifest(
+                self.network_config.chain_id, self.escrow_address
+            )
+            cached_manifest = get_escrow_manifest(
+                self.network_config.chain_id, self.escrow_address
+            )
+            self.assertEqual(cached_manifest, manifest)
+            mock_download.assert_called_once_with(mock_escrow.manifest_url)
+
     def test_store_results(self):
         escrow_address = create_escrow(self.w3)
         with patch("src.chain.escrow.get_web3") as mock_function:
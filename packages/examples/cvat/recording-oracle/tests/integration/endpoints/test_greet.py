@@ -0,0 +1,16 @@
+from fastapi.testclient import TestClient
+
+
+def test_greet_route(client: TestClient) -> None:
+    response = client.get("/")
+    assert response.status_code == 200
+    assert response.json()["message"] == "Recording Oracle API"
+
+
+def test_greet_route_not_modified(client: TestClient) -> None:
+    response = client.get("/")
+    etag = response.headers["etag"]
+
+    response = client.get("/", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.headers["etag"] == etag
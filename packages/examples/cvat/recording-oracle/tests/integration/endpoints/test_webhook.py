@@ -47,7 +47,7 @@ class ServiceIntegrationTest(unittest.TestCase):
             "/oracle-webhook", json=message, headers={"human-signature": signed_message}
         )
 
-        assert response.status_code == 200
+        assert response.status_code == 202
         response_body = response.json()
         webhook = (
             self.session.query(Webhook).where(Webhook.id == response_body["id"]).one()
@@ -53,20 +53,23 @@ Module
 import logging
 import os
 from decimal import Decimal
-from typing import List, Optional
+from typing import Any, Dict, List, Optional, Set, Tuple
 
 from human_protocol_sdk.constants import NETWORKS, ChainId, Status
 from human_protocol_sdk.utils import (
+    batch_call,
     get_escrow_interface,
     get_factory_interface,
     get_erc20_interface,
     handle_transaction,
+    is_address,
+    TRANSFER_EVENT_TOPIC,
 )
 from web3 import Web3, contract
 from web3 import eth
 from web3.middleware import geth_poa_middleware
 from web3.types import TxParams
-from eth_utils import abi
+from eth_utils import abi, event_abi_to_log_topic
 
 from human_protocol_sdk.utils import validate_url
 
@@ -119,15 +122,15 @@ class EscrowConfig:
         :param manifest_url: Manifest file url
         :param hash: Manifest file hash
         """
-        if not Web3.is_address(recording_oracle_address):
+        if not is_address(recording_oracle_address):
             raise EscrowClientError(
                 f"Invalid recording oracle address: {recording_oracle_address}"
             )
-        if not Web3.is_address(reputation_oracle_address):
+        if not is_address(reputation_oracle_address):
             raise EscrowClientError(
                 f"Invalid reputation oracle address: {reputation_oracle_address}"
             )
-        if not Web3.is_address(exchange_oracle_address):
+        if not is_address(exchange_oracle_address):
             raise EscrowClientError(
                 f"Invalid exchange oracle address: {exchange_oracle_address}"
             )
@@ -183,11 +186,24 @@ class EscrowClient:
             else:
                 raise EscrowClientError(f"Invalid Web3 Instance")
 
+        # Values that can't change once set on chain, keyed by (escrow, getter)
+        self._immutable_views: Dict[Tuple[str, str], Any] = {}
+        # Contract bindings are stateless, so they are built once per address
+        self._escrow_contracts: Dict[str, contract.Contract] = {}
+        self._token_contracts: Dict[str, contract.Contract] = {}
+        # Known trusted handlers per escrow, handlers can't be removed once added
+        self._trusted_handlers: Dict[str, Set[str]] = {}
+        # Final statuses reached by escrows, no transition leaves them
+        self._final_statuses: Dict[str, Status] = {}
+
         # Initialize contract instances
         factory_interface = get_factory_interface()
         self.factory_contract = self.w3.eth.contract(
             address=self.network["factory_address"], abi=factory_interface["abi"]
         )
+        self._launched_v2_topic = event_abi_to_log_topic(
+            self.factory_contract.events.LaunchedV2._get_event_abi()
+        )
 
     def create_escrow(
         self,
@@ -243,11 +259,11 @@ class EscrowClient:
                     job_requester_id
                 )
         """
-        if not Web3.is_address(token_address):
+        if not is_address(token_address):
             raise EscrowClientError(f"Invalid token address: {token_address}")
 
         for handler in trusted_handlers:
-            if not Web3.is_address(handler):
+            if not is_address(handler):
                 raise EscrowClientError(f"Invalid handler address: {handler}")
 
         transaction_receipt = handle_transaction(
@@ -263,7 +279,9 @@ class EscrowClient:
             (
                 self.factory_contract.events.LaunchedV2().process_log(log)
                 for log in transaction_receipt["logs"]
-                if log["address"] == self.network["factory_address"]
+                if log["topics"]
+                and log["topics"][0] == self._launched_v2_topic
+                and log["address"] == self.network["factory_address"]
             ),
             None,
         ).args.escrow
@@ -322,7 +340,7 @@ class EscrowClient:
                 escrow_client.setup(escrow_address, escrow_config)
         """
 
-        if not Web3.is_address(escrow_address):
+        if not is_address(escrow_address):
             raise EscrowClientError(f"Invalid escrow address: {escrow_address}")
 
         handle_transaction(
@@ -459,15 +477,13 @@ class EscrowClient:
                 escrow_client.fund("0x62dD51230A30401C455c8398d06F85e4EaB6309f", amount)
         """
 
-        if not Web3.is_address(escrow_address):
+        if not is_address(escrow_address):
             raise EscrowClientError(f"Invalid escrow address: {escrow_address}")
         if 0 >= amount:
             raise EscrowClientError("Amount must be positive")
 
         token_address = self.get_token_address(escrow_address)
-
-        erc20_interface = get_erc20_interface()
-        token_contract = self.w3.eth.contract(token_address, abi=erc20_interface["abi"])
+        token_contract = self._get_token_contract(token_address)
 
         handle_transaction(
             self.w3,
@@ -525,7 +541,7 @@ class EscrowClient:
                 )
         """
 
-        if not Web3.is_address(escrow_address):
+        if not is_address(escrow_address):
             raise EscrowClientError(f"Invalid escrow address: {escrow_address}")
         if not hash:
             raise EscrowClientError("Invalid empty hash")
@@ -580,7 +596,7 @@ class EscrowClient:
                 escrow_client.complete("0x62dD51230A30401C455c8398d06F85e4EaB6309f")
         """
 
-        if not Web3.is_address(escrow_address):
+        if not is_address(escrow_address):
             raise EscrowClientError(f"Invalid escrow address: {escrow_address}")
 
         handle_transaction(
@@ -590,6 +606,7 @@ class EscrowClient:
             EscrowClientError,
             tx_options,
         )
+        self._final_statuses[escrow_address.lower()] = Status.Complete
 
     def bulk_payout(
         self,
@@ -659,10 +676,10 @@ class EscrowClient:
                 )
         """
 
-        if not Web3.is_address(escrow_address):
+        if not is_address(escrow_address):
             raise EscrowClientError(f"Invalid escrow address: {escrow_address}")
         for recipient in recipients:
-            if not Web3.is_address(recipient):
+            if not is_address(recipient):
                 raise EscrowClientError(f"Invalid recipient address: {recipient}")
         if len(recipients) == 0:
             raise EscrowClientError("Arrays must have any value")
@@ -738,7 +755,7 @@ class EscrowClient:
                 )
         """
 
-        if not Web3.is_address(escrow_address):
+        if not is_address(escrow_address):
             raise EscrowClientError(f"Invalid escrow address: {escrow_address}")
 
         transaction_receipt = handle_transaction(
@@ -749,20 +766,22 @@ class EscrowClient:
             tx_options,
         )
 
+        self._final_statuses[escrow_address.lower()] = Status.Cancelled
+
         amount_transferred = None
         token_address = self.get_token_address(escrow_address)
-
-        erc20_interface = get_erc20_interface()
-        token_contract = self.w3.eth.contract(token_address, abi=erc20_interface["abi"])
+        token_contract = self._get_token_contract(token_address)
 
         for log in transaction_receipt["logs"]:
-            if log["address"] == token_address:
+            # Compare the raw topic first so only Transfer logs get ABI-decoded
+            if (
+                log["topics"]
+                and log["topics"][0] == TRANSFER_EVENT_TOPIC
+                and log["address"] == token_address
+            ):
                 processed_log = token_contract.events.Transfer().process_log(log)
 
-                if (
-                    processed_log["event"] == "Transfer"
-                    and processed_log["args"]["from"] == escrow_address
-                ):
+                if processed_log["args"]["from"] == escrow_address:
                     amount_transferred = processed_log["args"]["value"]
                     break
 
@@ -813,7 +832,7 @@ class EscrowClient:
                 escrow_client.abort("0x62dD51230A30401C455c8398d06F85e4EaB6309f")
         """
 
-        if not Web3.is_address(escrow_address):
+        if not is_address(escrow_address):
             raise EscrowClientError(f"Invalid escrow address: {escrow_address}")
 
         handle_transaction(
@@ -823,6 +842,13 @@ class EscrowClient:
             EscrowClientError,
             tx_options,
         )
+        # The contract self-destructs, so nothing is known about it anymore
+        escrow_key = escrow_address.lower()
+        self._final_statuses.pop(escrow_key, None)
+        self._trusted_handlers.pop(escrow_key, None)
+        self._escrow_contracts.pop(escrow_key, None)
+        for key in [key for key in self._immutable_views if key[0] == escrow_key]:
+            del self._immutable_views[key]
 
     def add_trusted_handlers(
         self,
@@ -872,10 +898,10 @@ class EscrowClient:
                     trusted_handlers
                 )
         """
-        if not Web3.is_address(escrow_address):
+        if not is_address(escrow_address):
             raise EscrowClientError(f"Invalid escrow address: {escrow_address}")
         for handler in handlers:
-            if not Web3.is_address(handler):
+            if not is_address(handler):
                 raise EscrowClientError(f"Invalid handler address: {handler}")
 
         handle_transaction(
@@ -887,6 +913,9 @@ class EscrowClient:
             EscrowClientError,
             tx_options,
         )
+        self._trusted_handlers.setdefault(escrow_address.lower(), set()).update(
+            handler.lower() for handler in handlers
+        )
 
     def get_balance(self, escrow_address: str) -> Decimal:
         """Gets the balance for a specified escrow address.
@@ -914,7 +943,7 @@ class EscrowClient:
                 )
         """
 
-        if not Web3.is_address(escrow_address):
+        if not is_address(escrow_address):
             raise EscrowClientError(f"Invalid escrow address: {escrow_address}")
 
         return self._get_escrow_contract(escrow_address).functions.getBalance().call()
@@ -945,10 +974,10 @@ class EscrowClient:
                 )
         """
 
-        if not Web3.is_address(escrow_address):
+        if not is_address(escrow_address):
             raise EscrowClientError(f"Invalid escrow address: {escrow_address}")
 
-        return self._get_escrow_contract(escrow_address).functions.manifestHash().call()
+        return self._call_immutable_view(escrow_address, "manifestHash")
 
     def get_manifest_url(self, escrow_address: str) -> str:
         """Gets the manifest file URL.
@@ -976,10 +1005,44 @@ class EscrowClient:
                 )
         """
 
-        if not Web3.is_address(escrow_address):
+        if not is_address(escrow_address):
             raise EscrowClientError(f"Invalid escrow address: {escrow_address}")
 
-        return self._get_escrow_contract(escrow_address).functions.manifestUrl().call()
+        return self._call_immutable_view(escrow_address, "manifestUrl")
+
+    def get_manifest_url_and_hash(self, escrow_address: str) -> Tuple[str, str]:
+        """Gets the manifest file URL and hash, reading both in a single round-trip.
+
+        :param escrow_address: Address of the escrow
+
+        :return: Manifest file url and manifest file hash
+
+        :raise EscrowClientError: If an error occurs while checking the parameters
+
+        :example:
+            .. code-block:: python
+
+                from eth_typing import URI
+                from web3 import Web3
+                from web3.providers.auto import load_provider_from_uri
+
+                from human_protocol_sdk.escrow import EscrowClient
+
+                w3 = Web3(load_provider_from_uri(URI("http://localhost:8545")))
+                escrow_client = EscrowClient(w3)
+
+                url, hash = escrow_client.get_manifest_url_and_hash(
+                    "0x62dD51230A30401C455c8398d06F85e4EaB6309f"
+                )
+        """
+
+        if not is_address(escrow_address):
+            raise EscrowClientError(f"Invalid escrow address: {escrow_address}")
+
+        url, hash = self._call_immutable_views(
+            escrow_address, ["manifestUrl", "manifestHash"]
+        )
+        return url, hash
 
     def get_results_url(self, escrow_address: str) -> str:
         """Gets the results file URL.
@@ -1007,9 +1070,13 @@ class EscrowClient:
                 )
         """
 
-        if not Web3.is_address(escrow_address):
+        if not is_address(escrow_address):
             raise EscrowClientError(f"Invalid escrow address: {escrow_address}")
 
+        # No payouts can happen after completion, so the url is final by then
+        if self._final_statuses.get(escrow_address.lower()) == Status.Complete:
+            return self._call_immutable_view(escrow_address, "finalResultsUrl")
+
         return (
             self._get_escrow_contract(escrow_address).functions.finalResultsUrl().call()
         )
@@ -1040,7 +1107,7 @@ class EscrowClient:
                 )
         """
 
-        if not Web3.is_address(escrow_address):
+        if not is_address(escrow_address):
             raise EscrowClientError(f"Invalid escrow address: {escrow_address}")
 
         return (
@@ -1075,10 +1142,10 @@ class EscrowClient:
                 )
         """
 
-        if not Web3.is_address(escrow_address):
+        if not is_address(escrow_address):
             raise EscrowClientError(f"Invalid escrow address: {escrow_address}")
 
-        return self._get_escrow_contract(escrow_address).functions.token().call()
+        return self._call_immutable_view(escrow_address, "token")
 
     def get_status(self, escrow_address: str) -> Status:
         """Gets the current status of the escrow.
@@ -1106,12 +1173,20 @@ class EscrowClient:
                 )
         """
 
-        if not Web3.is_address(escrow_address):
+        if not is_address(escrow_address):
             raise EscrowClientError(f"Invalid escrow address: {escrow_address}")
 
-        return Status(
+        final_status = self._final_statuses.get(escrow_address.lower())
+        if final_status is not None:
+            return final_status
+
+        status = Status(
             self._get_escrow_contract(escrow_address).functions.status().call()
         )
+        # Paid can still move to Complete, only these two are terminal
+        if status in (Status.Complete, Status.Cancelled):
+            self._final_statuses[escrow_address.lower()] = status
+        return status
 
     def get_recording_oracle_address(self, escrow_address: str) -> str:
         """Gets the recording oracle address of the escrow.
@@ -1139,7 +1214,7 @@ class EscrowClient:
                 )
         """
 
-        if not Web3.is_address(escrow_address):
+        if not is_address(escrow_address):
             raise EscrowClientError(f"Invalid escrow address: {escrow_address}")
 
         return (
@@ -1172,7 +1247,7 @@ class EscrowClient:
                 )
         """
 
-        if not Web3.is_address(escrow_address):
+        if not is_address(escrow_address):
             raise EscrowClientError(f"Invalid escrow address: {escrow_address}")
 
         return (
@@ -1207,7 +1282,7 @@ class EscrowClient:
                 )
         """
 
-        if not Web3.is_address(escrow_address):
+        if not is_address(escrow_address):
             raise EscrowClientError(f"Invalid escrow address: {escrow_address}")
 
         return (
@@ -1240,10 +1315,57 @@ class EscrowClient:
                 )
         """
 
-        if not Web3.is_address(escrow_address):
+        if not is_address(escrow_address):
+            raise EscrowClientError(f"Invalid escrow address: {escrow_address}")
+
+        return self._call_immutable_view(escrow_address, "launcher")
+
+    def is_trusted_handler(self, escrow_address: str, handler: str) -> bool:
+        """Checks if the address is a trusted handler of the escrow.
+
+        :param escrow_address: Address of the escrow
+        :param handler: Address to check
+
+        :return: True if the address is a trusted handler, False otherwise
+
+        :raise EscrowClientError: If an error occurs while checking the parameters
+
+        :example:
+            .. code-block:: python
+
+                from eth_typing import URI
+                from web3 import Web3
+                from web3.providers.auto import load_provider_from_uri
+
+                from human_protocol_sdk.escrow import EscrowClient
+
+                w3 = Web3(load_provider_from_uri(URI("http://localhost:8545")))
+                escrow_client = EscrowClient(w3)
+
+                is_trusted = escrow_client.is_trusted_handler(
+                    "0x62dD51230A30401C455c8398d06F85e4EaB6309f",
+                    "0x70997970C51812dc3A010C7d01b50e0d17dc79C8"
+                )
+        """
+
+        if not is_address(escrow_address):
             raise EscrowClientError(f"Invalid escrow address: {escrow_address}")
+        if not is_address(handler):
+            raise EscrowClientError(f"Invalid handler address: {handler}")
 
-        return self._get_escrow_contract(escrow_address).functions.launcher().call()
+        if handler.lower() in self._trusted_handlers.get(escrow_address.lower(), ()):
+            return True
+
+        is_trusted = (
+            self._get_escrow_contract(escrow_address)
+            .functions.areTrustedHandlers(handler)
+            .call()
+        )
+        if is_trusted:
+            self._trusted_handlers.setdefault(escrow_address.lower(), set()).add(
+                handler.lower()
+            )
+        return is_trusted
 
     def get_factory_address(self, escrow_address: str) -> str:
         """Gets the escrow factory address of the escrow.
@@ -1271,12 +1393,10 @@ class EscrowClient:
                 )
         """
 
-        if not Web3.is_address(escrow_address):
+        if not is_address(escrow_address):
             raise EscrowClientError(f"Invalid escrow address: {escrow_address}")
 
-        return (
-            self._get_escrow_contract(escrow_address).functions.escrowFactory().call()
-        )
+        return self._call_immutable_view(escrow_address, "escrowFactory")
 
     def _get_escrow_contract(self, address: str) -> contract.Contract:
         """Returns the escrow contract instance.
@@ -1287,8 +1407,76 @@ class EscrowClient:
 
         """
 
-        if not self.factory_contract.functions.hasEscrow(address):
-            raise EscrowClientError("Escrow address is not provided by the factory")
-        # Initialize contract instance
-        escrow_interface = get_escrow_interface()
-        return self.w3.eth.contract(address=address, abi=escrow_interface["abi"])
+        escrow_contract = self._escrow_contracts.get(address.lower())
+        if escrow_contract is None:
+            if not self.factory_contract.functions.hasEscrow(address):
+                raise EscrowClientError("Escrow address is not provided by the factory")
+            # Initialize contract instance
+            escrow_interface = get_escrow_interface()
+            escrow_contract = self.w3.eth.contract(
+                address=address, abi=escrow_interface["abi"]
+            )
+            self._escrow_contracts[address.lower()] = escrow_contract
+        return escrow_contract
+
+    def _get_token_contract(self, address: str) -> contract.Contract:
+        """Returns the ERC20 contract instance of the token.
+
+        :param address: Address of the token
+
+        :return: The instance of the token contract
+
+        """
+
+        token_contract = self._token_contracts.get(address)
+        if token_contract is None:
+            erc20_interface = get_erc20_interface()
+            token_contract = self.w3.eth.contract(address, abi=erc20_interface["abi"])
+            self._token_contracts[address] = token_contract
+        return token_contract
+
+    def _call_immutable_view(self, escrow_address: str, fn_name: str) -> Any:
+        """Calls a getter whose value never changes once it is set on chain.
+
+        The token, launcher and factory are set when the escrow is created and
+        the manifest url and hash when it is set up, so non-empty values are
+        memoized to save a round-trip on later reads.
+
+        :param escrow_address: Address of the escrow
+        :param fn_name: Name of the contract getter
+
+        :return: The value returned by the getter
+        """
+
+        return self._call_immutable_views(escrow_address, [fn_name])[0]
+
+    def _call_immutable_views(
+        self, escrow_address: str, fn_names: List[str]
+    ) -> List[Any]:
+        """Calls several immutable getters, see _call_immutable_view.
+
+        Getters that are not memoized yet are sent as one batch request.
+
+        :param escrow_address: Address of the escrow
+        :param fn_names: Names of the contract getters
+
+        :return: The values returned by the getters, in the same order
+        """
+
+        keys = [(escrow_address.lower(), fn_name) for fn_name in fn_names]
+        missing = [key for key in keys if key not in self._immutable_views]
+        fetched = {}
+        if missing:
+            functions = self._get_escrow_contract(escrow_address).functions
+            calls = [getattr(functions, fn_name)() for _, fn_name in missing]
+            if len(calls) == 1:
+                values = [calls[0].call()]
+            else:
+                values = batch_call(self.w3, calls, EscrowClientError)
+
+            fetched = dict(zip(missing, values))
+            for key, value in fetched.items():
+                if value:
+                    self._immutable_views[key] = value
+
+        return [self._immutable_views.get(key, fetched.get(key)) for key in keys]
@@ -26,21 +26,17 @@ Module
 
 from datetime import datetime
 import logging
-import os
 from typing import List, Optional
 
-from web3 import Web3
-
 from human_protocol_sdk.constants import NETWORKS, ChainId
 from human_protocol_sdk.filter import EscrowFilter
 from human_protocol_sdk.utils import (
     get_data_from_subgraph,
+    is_address,
 )
 
 from human_protocol_sdk.escrow.escrow_client import EscrowClientError
 
-GAS_LIMIT = int(os.getenv("GAS_LIMIT", 4712388))
-
 LOG = logging.getLogger("human_protocol_sdk.escrow")
 
 
@@ -270,7 +266,7 @@ class EscrowUtils:
         if chain_id.value not in set(chain_id.value for chain_id in ChainId):
             raise EscrowClientError(f"Invalid ChainId")
 
-        if not Web3.is_address(escrow_address):
+        if not is_address(escrow_address):
             raise EscrowClientError(f"Invalid escrow address: {escrow_address}")
 
         network = NETWORKS[ChainId(chain_id)]
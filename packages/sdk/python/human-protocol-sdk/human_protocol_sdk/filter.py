@@ -5,8 +5,7 @@ from datetime import datetime
 from typing import List, Optional
 
 from human_protocol_sdk.constants import NETWORKS, ChainId, Status
-
-from web3 import Web3
+from human_protocol_sdk.utils import is_address
 
 
 class FilterError(Exception):
@@ -54,16 +53,16 @@ class EscrowFilter:
         ):
             raise FilterError(f"Invalid ChainId")
 
-        if launcher and not Web3.is_address(launcher):
+        if launcher and not is_address(launcher):
             raise FilterError(f"Invalid address: {launcher}")
 
-        if reputation_oracle and not Web3.is_address(reputation_oracle):
+        if reputation_oracle and not is_address(reputation_oracle):
             raise FilterError(f"Invalid address: {reputation_oracle}")
 
-        if recording_oracle and not Web3.is_address(recording_oracle):
+        if recording_oracle and not is_address(recording_oracle):
             raise FilterError(f"Invalid address: {recording_oracle}")
 
-        if exchange_oracle and not Web3.is_address(exchange_oracle):
+        if exchange_oracle and not is_address(exchange_oracle):
             raise FilterError(f"Invalid address: {exchange_oracle}")
 
         if date_from and date_to and date_from > date_to:
@@ -103,10 +102,10 @@ class PayoutFilter:
         :param date_to: Created to date
         """
 
-        if escrow_address and not Web3.is_address(escrow_address):
+        if escrow_address and not is_address(escrow_address):
             raise FilterError(f"Invalid address: {escrow_address}")
 
-        if recipient and not Web3.is_address(recipient):
+        if recipient and not is_address(recipient):
             raise FilterError(f"Invalid address: {recipient}")
 
         if date_from and date_to and date_from > date_to:
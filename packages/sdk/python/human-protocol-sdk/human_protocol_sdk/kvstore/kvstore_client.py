@@ -60,6 +60,7 @@ from human_protocol_sdk.constants import NETWORKS, ChainId, KVStoreKeys
 from human_protocol_sdk.utils import (
     get_kvstore_interface,
     handle_transaction,
+    is_address,
     validate_url,
 )
 from web3 import Web3
@@ -297,7 +298,7 @@ class KVStoreClient:
 
         if not key:
             raise KVStoreClientError("Key can not be empty")
-        if not Web3.is_address(address):
+        if not is_address(address):
             raise KVStoreClientError(f"Invalid address: {address}")
         result = self.kvstore_contract.functions.get(address, key).call()
         return result
@@ -333,7 +334,7 @@ class KVStoreClient:
                 )
         """
 
-        if not Web3.is_address(address):
+        if not is_address(address):
             raise KVStoreClientError(f"Invalid address: {address}")
 
         url = self.kvstore_contract.functions.get(address, key).call()
@@ -20,15 +20,11 @@ Module
 """
 
 import logging
-import os
 from typing import List, Optional
 
 from human_protocol_sdk.constants import NETWORKS, ChainId
 from human_protocol_sdk.gql.reward import get_reward_added_events_query
-from human_protocol_sdk.utils import get_data_from_subgraph
-from web3 import Web3
-
-GAS_LIMIT = int(os.getenv("GAS_LIMIT", 4712388))
+from human_protocol_sdk.utils import get_data_from_subgraph, is_address
 
 LOG = logging.getLogger("human_protocol_sdk.operator")
 
@@ -263,7 +259,7 @@ class OperatorUtils:
         if chain_id.value not in set(chain_id.value for chain_id in ChainId):
             raise OperatorUtilsError(f"Invalid ChainId")
 
-        if not Web3.is_address(leader_address):
+        if not is_address(leader_address):
             raise OperatorUtilsError(f"Invalid leader address: {leader_address}")
 
         network = NETWORKS[chain_id]
@@ -329,7 +325,7 @@ class OperatorUtils:
         if chain_id.value not in set(chain_id.value for chain_id in ChainId):
             raise OperatorUtilsError(f"Invalid ChainId")
 
-        if not Web3.is_address(address):
+        if not is_address(address):
             raise OperatorUtilsError(f"Invalid reputation address: {address}")
 
         network = NETWORKS[chain_id]
@@ -373,7 +369,7 @@ class OperatorUtils:
         if chain_id.value not in set(chain_id.value for chain_id in ChainId):
             raise OperatorUtilsError(f"Invalid ChainId")
 
-        if not Web3.is_address(slasher):
+        if not is_address(slasher):
             raise OperatorUtilsError(f"Invalid slasher address: {slasher}")
 
         network = NETWORKS[chain_id]
@@ -51,10 +51,9 @@ Module
 """
 
 import logging
-import os
 
 from decimal import Decimal
-from typing import Optional
+from typing import Optional, Set
 
 import web3
 from web3 import Web3
@@ -70,8 +69,6 @@ from human_protocol_sdk.utils import (
     handle_transaction,
 )
 
-GAS_LIMIT = int(os.getenv("GAS_LIMIT", 4712388))
-
 LOG = logging.getLogger("human_protocol_sdk.staking")
 
 
@@ -162,6 +159,9 @@ class StakingClient:
             abi=reward_pool_interface["abi"],
         )
 
+        # Escrows registered by the factory, it never unregisters them
+        self._known_escrows: Set[str] = set()
+
     def approve_stake(
         self, amount: Decimal, tx_options: Optional[TxParams] = None
     ) -> None:
@@ -647,4 +647,10 @@ class StakingClient:
         """
 
         # TODO: Use Escrow/Job Module once implemented
-        return self.factory_contract.functions.hasEscrow(escrow_address).call()
+        if escrow_address.lower() in self._known_escrows:
+            return True
+
+        is_valid = self.factory_contract.functions.hasEscrow(escrow_address).call()
+        if is_valid:
+            self._known_escrows.add(escrow_address.lower())
+        return is_valid
@@ -153,7 +153,7 @@ class StorageClient:
             self.endpoint = endpoint_url
             self.secure = secure
         except Exception as e:
-            LOG.error(f"Connection with S3 failed because of: {e}")
+            LOG.error("Connection with S3 failed because of: %s", e)
             raise e
 
     def download_files(self, files: List[str], bucket: str) -> List[bytes]:
@@ -198,11 +198,9 @@ class StorageClient:
                 response = self.client.get_object(bucket_name=bucket, object_name=file)
                 result_files.append(response.read())
             except Exception as e:
-                if hasattr(e, "code") and str(e.code) == "NoSuchKey":
+                if str(getattr(e, "code", None)) == "NoSuchKey":
                     raise StorageFileNotFoundError("No object found - returning empty")
-                LOG.warning(
-                    f"Reading the key {file} with S3 failed" f" because of: {str(e)}"
-                )
+                LOG.warning("Reading the key %s with S3 failed because of: %s", file, e)
                 raise StorageClientError(str(e))
         return result_files
 
@@ -242,6 +240,7 @@ class StorageClient:
                 )
         """
         result_files = []
+        bucket_url = f"{'https' if self.secure else 'http'}://{self.endpoint}/{bucket}"
         for file in files:
             if "file" in file and "key" in file and "hash" in file:
                 data = file["file"]
@@ -257,9 +256,7 @@ class StorageClient:
                 hash = hashlib.sha1(data).hexdigest()
                 key = f"s3{hash}.json"
 
-            url = (
-                f"{'https' if self.secure else 'http'}://{self.endpoint}/{bucket}/{key}"
-            )
+            url = f"{bucket_url}/{key}"
             file_exist = None
 
             try:
@@ -268,12 +265,12 @@ class StorageClient:
                     bucket_name=bucket, object_name=key
                 )
             except Exception as e:
-                if hasattr(e, "code") and str(e.code) == "NoSuchKey":
+                if str(getattr(e, "code", None)) == "NoSuchKey":
                     # file does not exist in bucket, so upload it
                     pass
                 else:
                     LOG.warning(
-                        f"Reading the key {key} in S3 failed" f" because of: {str(e)}"
+                        "Reading the key %s in S3 failed because of: %s", key, e
                     )
                     raise StorageClientError(str(e))
 
@@ -286,7 +283,7 @@ class StorageClient:
                         data=io.BytesIO(data),
                         length=len(data),
                     )
-                    LOG.debug(f"Uploaded to S3, key: {key}")
+                    LOG.debug("Uploaded to S3, key: %s", key)
                 except Exception as e:
                     raise StorageClientError(str(e))
 
@@ -330,9 +327,7 @@ class StorageClient:
         try:
             return self.client.bucket_exists(bucket_name=bucket)
         except Exception as e:
-            LOG.warning(
-                f"Checking the bucket {bucket} in S3 failed" f" because of: {str(e)}"
-            )
+            LOG.warning("Checking the bucket %s in S3 failed because of: %s", bucket, e)
             raise StorageClientError(str(e))
 
     def list_objects(self, bucket: str) -> List[str]:
@@ -375,5 +370,5 @@ class StorageClient:
             else:
                 return []
         except Exception as e:
-            LOG.warning(f"Listing objects in S3 failed because of: {str(e)}")
+            LOG.warning("Listing objects in S3 failed because of: %s", e)
             raise StorageClientError(str(e))
@@ -1,38 +1,60 @@
 import json
 import logging
+import random
 import time
 import re
-from typing import Tuple, Optional
+from functools import lru_cache
+from typing import Any, List, Tuple, Optional
 
 import requests
+import web3
 from validators import url as URL
-from web3 import Web3
+from web3 import HTTPProvider, Web3
 from web3.contract import Contract
+from web3.contract.contract import ContractFunction
 from web3.types import TxReceipt
 from web3.exceptions import ContractLogicError
-from web3.types import TxParams
+from web3.types import BlockIdentifier, TxParams
 
 from human_protocol_sdk.constants import ARTIFACTS_FOLDER
 
 logger = logging.getLogger("human_protocol_sdk.utils")
 
+# web3 has no public batch request API before v7, so batch_call relies on
+# these internals and is only enabled for the major version it was built on.
+try:
+    from web3._utils.abi import get_abi_output_types, map_abi_data
+    from web3._utils.normalizers import BASE_RETURN_NORMALIZERS
+    from web3._utils.request import make_post_request
 
-def with_retry(fn, retries=3, delay=5, backoff=2):
+    BATCH_CALL_SUPPORTED = web3.__version__.startswith("6.")
+except ImportError:
+    BATCH_CALL_SUPPORTED = False
+
+TRANSFER_EVENT_TOPIC = Web3.keccak(text="Transfer(address,address,uint256)")
+
+
+def with_retry(fn, retries=3, delay=5, backoff=2, max_delay=60, jitter=1):
     """Retry a function
 
     Mainly used with handle_transaction to retry on case of failure.
-    Uses expnential backoff.
+    Uses exponential backoff with random jitter, so that clients rate-limited
+    by the same endpoint do not retry in lockstep.
 
     :param fn: <Partial> to run with retry logic.
     :param retries: number of times to retry the transaction
     :param delay: time to wait (exponentially)
     :param backoff: defines the rate of grow for the exponential wait.
+    :param max_delay: upper bound for the exponential wait, in seconds.
+    :param jitter: upper bound for the random time added to each wait, in seconds.
 
     :return: False if transaction never succeeded,
         otherwise the return of the function
 
     :note: If the partial returns a Boolean and it happens to be False,
         we would not know if the tx succeeded and it will retry.
+        Reverted transactions are not retried, as they would revert again.
+        This includes reverts re-raised by handle_transaction as client errors.
     """
 
     wait_time = delay
@@ -44,13 +66,39 @@ def with_retry(fn, retries=3, delay=5, backoff=2):
                 return result
         except Exception as e:
             name = getattr(fn, "__name__", "partial")
+            if _is_revert(e):
+                logger.warning("%s reverted: %s. Not retrying.", name, e)
+                return False
             logger.warning(
-                f"(x{i+1}) {name} exception: {e}. Retrying after {wait_time} sec..."
+                "(x%d) %s exception: %s. Retrying after %s sec...",
+                i + 1,
+                name,
+                e,
+                wait_time,
             )
 
-        time.sleep(wait_time)
-        wait_time *= backoff
+        time.sleep(wait_time + random.uniform(0, jitter))
+        wait_time = min(wait_time * backoff, max_delay)
+
+    return False
+
 
+def _is_revert(error: Optional[BaseException]) -> bool:
+    """Checks if the error, or any error it was raised from, is a contract revert.
+
+    :param error: Error to check
+
+    :return: True if the error comes from a reverted transaction
+    """
+
+    while error is not None:
+        if isinstance(error, ContractLogicError) or (
+            error.args
+            and isinstance(error.args[0], str)
+            and "reverted with reason string" in error.args[0]
+        ):
+            return True
+        error = error.__cause__
     return False
 
 
@@ -85,8 +133,15 @@ def parse_transfer_transaction(
     if not tx_receipt:
         return hmt_transferred, tx_balance
 
+    # Skip decoding every log of receipts without any transfer
+    if not any(
+        log["topics"] and log["topics"][0] == TRANSFER_EVENT_TOPIC
+        for log in tx_receipt.get("logs", ())
+    ):
+        return hmt_transferred, tx_balance
+
     transfer_event = hmtoken_contract.events.Transfer().process_receipt(tx_receipt)
-    logger.info(f"Transfer_event {transfer_event}.")
+    logger.info("Transfer_event %s.", transfer_event)
 
     hmt_transferred = bool(transfer_event)
 
@@ -96,9 +151,124 @@ def parse_transfer_transaction(
     return hmt_transferred and tx_balance is not None, tx_balance
 
 
+def batch_call(
+    w3: Web3,
+    calls: List[ContractFunction],
+    exception: Exception,
+    block_identifier: BlockIdentifier = "latest",
+) -> List[Any]:
+    """Executes several read-only contract calls in a single JSON-RPC batch.
+
+    Each ``eth_call`` is encoded locally and all of them are sent in one
+    HTTP request, so N contract reads cost one round-trip instead of N.
+    Like ``ContractFunction.call``, the default account is used as ``from``.
+
+    The batch bypasses web3's request pipeline: it relies on private
+    ``web3._utils`` helpers to encode and decode the calls, and posts the
+    payload straight to the provider endpoint with ``make_post_request``.
+    None of the middlewares installed on ``w3`` (e.g. ``geth_poa`` or the
+    signing middleware) see these requests, so only plain ``eth_call`` reads
+    should go through it. The private helpers are only used with web3 6.x.
+
+    Calls are made one by one through ``ContractFunction.call``, with the full
+    middleware stack, if the provider is not an HTTP provider, the installed
+    web3 version is not supported or the node refuses the batch.
+
+    :param w3: Web3 instance
+    :param calls: Contract functions to call, e.g. ``contract.functions.status()``
+    :param exception: Exception class to raise in case of error
+    :param block_identifier: Block to run the calls against, defaults to "latest"
+
+    :return: The decoded results, in the same order as ``calls``
+
+    :raise exception: If the node returns an error or an incomplete response
+    """
+
+    if not calls:
+        return []
+
+    if not BATCH_CALL_SUPPORTED or not isinstance(w3.provider, HTTPProvider):
+        return [call.call(block_identifier=block_identifier) for call in calls]
+
+    tx_params = {}
+    if w3.eth.default_account:
+        tx_params["from"] = w3.eth.default_account
+    block = (
+        block_identifier
+        if isinstance(block_identifier, str)
+        else Web3.to_hex(block_identifier)
+    )
+    payload = [
+        {
+            "jsonrpc": "2.0",
+            "id": i,
+            "method": "eth_call",
+            "params": [
+                {
+                    **tx_params,
+                    "to": call.address,
+                    "data": call._encode_transaction_data(),
+                },
+                block,
+            ],
+        }
+        for i, call in enumerate(calls)
+    ]
+
+    try:
+        responses = json.loads(
+            make_post_request(
+                w3.provider.endpoint_uri,
+                json.dumps(payload).encode(),
+                **w3.provider.get_request_kwargs(),
+            )
+        )
+    except (requests.HTTPError, ValueError) as e:
+        logger.warning("Batch call rejected: %s. Calling one by one.", e)
+        responses = None
+    except requests.RequestException as e:
+        raise exception(f"Batch call failed: {e}") from e
+
+    # Nodes that do not support batches answer with a single error object
+    if not isinstance(responses, list):
+        if responses is not None:
+            logger.warning("Batch call rejected: %s. Calling one by one.", responses)
+        return [call.call(block_identifier=block_identifier) for call in calls]
+
+    responses_by_id = {
+        response.get("id"): response
+        for response in responses
+        if isinstance(response, dict)
+    }
+
+    results = []
+    for i, call in enumerate(calls):
+        response = responses_by_id.get(i)
+        if response is None:
+            raise exception(f"Batch call failed: no response for {call.fn_name}")
+        if "error" in response or "result" not in response:
+            error = response.get("error", "no result")
+            message = error.get("message", error) if isinstance(error, dict) else error
+            raise exception(f"{call.fn_name} call failed: {message}")
+
+        output_types = get_abi_output_types(call.abi)
+        decoded = map_abi_data(
+            BASE_RETURN_NORMALIZERS,
+            output_types,
+            w3.codec.decode(output_types, Web3.to_bytes(hexstr=response["result"])),
+        )
+        results.append(decoded[0] if len(decoded) == 1 else decoded)
+
+    return results
+
+
+@lru_cache(maxsize=None)
 def get_contract_interface(contract_entrypoint):
     """Retrieve the contract interface of a given contract.
 
+    The artifact is read and parsed once per process, every client shares
+    the resulting interface, so it must not be mutated.
+
     :param contract_entrypoint: the entrypoint of the JSON.
 
     :return: The contract interface containing the contract abi.
@@ -231,16 +401,38 @@ def handle_transaction(
             "execution reverted: "
         )
         message = e.args[0][start_index:]
-        raise exception(f"{tx_name} transaction failed: {message}")
+        raise exception(f"{tx_name} transaction failed: {message}") from e
     except Exception as e:
-        logger.exception(f"Handle transaction error: {e}")
+        logger.exception("Handle transaction error: %s", e)
         if "reverted with reason string" in e.args[0]:
             start_index = e.args[0].find("'") + 1
             end_index = e.args[0].rfind("'")
             message = e.args[0][start_index:end_index]
-            raise exception(f"{tx_name} transaction failed: {message}")
+            raise exception(f"{tx_name} transaction failed: {message}") from e
         else:
-            raise exception(f"{tx_name} transaction failed.")
+            raise exception(f"{tx_name} transaction failed.") from e
+
+
+@lru_cache(maxsize=4096)
+def _is_address(value: str) -> bool:
+    return Web3.is_address(value)
+
+
+def is_address(value: Any) -> bool:
+    """Checks if the given value is a valid address.
+
+    Checksummed addresses need a keccak hash to be validated and the same
+    escrow and recipient addresses are checked over and over, so string
+    results are memoized.
+
+    :param value: Value to check
+
+    :return: True if the value is a valid address, False otherwise
+    """
+
+    if isinstance(value, str):
+        return _is_address(value)
+    return Web3.is_address(value)
 
 
 def validate_url(url: str) -> bool:
@@ -9,6 +9,7 @@ from human_protocol_sdk.escrow import EscrowClient, EscrowClientError, EscrowCon
 from human_protocol_sdk.filter import EscrowFilter, FilterError
 from web3 import Web3
 from web3.constants import ADDRESS_ZERO
+from web3.datastructures import AttributeDict
 from web3.middleware import construct_sign_and_send_raw_middleware
 from web3.providers.rpc import HTTPProvider
 
@@ -368,6 +369,53 @@ class TestEscrowClient(unittest.TestCase):
                     None,
                 )
 
+    def test_create_escrow_skips_other_factory_logs(self):
+        self.escrow.factory_contract.functions.createEscrow = MagicMock()
+        escrow_address = "0x1234567890123456789012345678901234567890"
+        token_address = "0x1234567890123456789012345678901234567891"
+        log = {
+            "address": NETWORKS[ChainId.LOCALHOST]["factory_address"],
+            "blockHash": b"\x00" * 32,
+            "blockNumber": 1,
+            "logIndex": 0,
+            "transactionHash": b"\x00" * 32,
+            "transactionIndex": 0,
+        }
+        transaction_receipt = {
+            "logs": [
+                AttributeDict(
+                    {
+                        **log,
+                        "topics": [Web3.keccak(text="Upgraded(address)")],
+                        "data": b"",
+                    }
+                ),
+                AttributeDict(
+                    {
+                        **log,
+                        "logIndex": 1,
+                        "topics": [
+                            Web3.keccak(text="LaunchedV2(address,address,string)")
+                        ],
+                        "data": self.w3.codec.encode(
+                            ["address", "address", "string"],
+                            [token_address, escrow_address, "job-requester"],
+                        ),
+                    }
+                ),
+            ]
+        }
+
+        with patch(
+            "human_protocol_sdk.escrow.escrow_client.handle_transaction",
+            return_value=transaction_receipt,
+        ):
+            response = self.escrow.create_escrow(
+                token_address, [self.w3.eth.default_account], "job-requester"
+            )
+
+        self.assertEqual(response, escrow_address)
+
     def test_create_escrow_invalid_token(self):
         token_address = "invalid_address"
         trusted_handlers = [self.w3.eth.default_account]
@@ -1536,6 +1584,61 @@ class TestEscrowClient(unittest.TestCase):
             self.assertEqual(escrow_cancel_data.txHash, tx_hash.hex())
             self.assertEqual(escrow_cancel_data.amountRefunded, amount_refunded)
 
+    def test_cancel_skips_other_token_logs(self):
+        mock_contract = MagicMock()
+        self.escrow._get_escrow_contract = MagicMock(return_value=mock_contract)
+        escrow_address = "0xa76507AbFE3B67cB25F16DbC75a883D4190B7e46"
+        token_address = "0x0376D26246Eb35FF4F9924cF13E6C05fd0bD7Fb4"
+        self.escrow.get_token_address = MagicMock(return_value=token_address)
+        tx_hash = bytes.fromhex(
+            "01682095d5abb0270d11a31139b9a1f410b363c84add467004e728ec831bd529"
+        )
+        log = {
+            "transactionIndex": 0,
+            "transactionHash": tx_hash,
+            "blockHash": bytes.fromhex(
+                "92abf9325a3959a911a2581e9ea36cba3060d8b293b50e5738ff959feb95258a"
+            ),
+            "blockNumber": 5,
+            "address": token_address,
+            "data": bytes.fromhex(
+                "000000000000000000000000000000000000000000000000029b003c075b5e42"
+            ),
+        }
+
+        with patch(
+            "human_protocol_sdk.escrow.escrow_client.handle_transaction"
+        ) as mock_function:
+            mock_function.return_value = {
+                "transactionHash": tx_hash,
+                "logs": [
+                    {
+                        **log,
+                        "logIndex": 0,
+                        "topics": [
+                            Web3.keccak(text="Approval(address,address,uint256)")
+                        ],
+                    },
+                    {
+                        **log,
+                        "logIndex": 1,
+                        "topics": [
+                            Web3.keccak(text="Transfer(address,address,uint256)"),
+                            bytes.fromhex(
+                                "000000000000000000000000a76507abfe3b67cb25f16dbc75a883d4190b7e46"
+                            ),
+                            bytes.fromhex(
+                                "0000000000000000000000005607acf0828e238099aa1784541a5abd7f975c76"
+                            ),
+                        ],
+                    },
+                ],
+            }
+
+            escrow_cancel_data = self.escrow.cancel(escrow_address)
+
+        self.assertEqual(escrow_cancel_data.amountRefunded, 187744067287473730)
+
     def test_cancel_invalid_address(self):
         escrow_address = "invalid_address"
 
@@ -1950,6 +2053,34 @@ class TestEscrowClient(unittest.TestCase):
             self.escrow.get_manifest_hash("invalid_address")
         self.assertEqual(f"Invalid escrow address: invalid_address", str(cm.exception))
 
+    def test_get_manifest_url_and_hash(self):
+        mock_contract = MagicMock()
+        self.escrow._get_escrow_contract = MagicMock(return_value=mock_contract)
+        escrow_address = "0x1234567890123456789012345678901234567890"
+
+        with patch(
+            "human_protocol_sdk.escrow.escrow_client.batch_call",
+            return_value=["mock_url", "mock_hash"],
+        ) as mock_batch_call:
+            result = self.escrow.get_manifest_url_and_hash(escrow_address)
+            self.assertEqual(self.escrow.get_manifest_url(escrow_address), "mock_url")
+
+        mock_batch_call.assert_called_once_with(
+            self.escrow.w3,
+            [
+                mock_contract.functions.manifestUrl.return_value,
+                mock_contract.functions.manifestHash.return_value,
+            ],
+            EscrowClientError,
+        )
+        mock_contract.functions.manifestUrl.return_value.call.assert_not_called()
+        self.assertEqual(result, ("mock_url", "mock_hash"))
+
+    def test_get_manifest_url_and_hash_invalid_address(self):
+        with self.assertRaises(EscrowClientError) as cm:
+            self.escrow.get_manifest_url_and_hash("invalid_address")
+        self.assertEqual(f"Invalid escrow address: invalid_address", str(cm.exception))
+
     def test_get_manifest_url(self):
         mock_contract = MagicMock()
         mock_contract.functions.manifestUrl = MagicMock()
@@ -1965,6 +2096,51 @@ class TestEscrowClient(unittest.TestCase):
         mock_contract.functions.manifestUrl.assert_called_once_with()
         self.assertEqual(result, "mock_value")
 
+    def test_get_manifest_url_memoized(self):
+        mock_contract = MagicMock()
+        mock_contract.functions.manifestUrl = MagicMock()
+        mock_contract.functions.manifestUrl.return_value.call.return_value = (
+            "mock_value"
+        )
+        self.escrow._get_escrow_contract = MagicMock(return_value=mock_contract)
+        escrow_address = "0x1234567890123456789012345678901234567890"
+
+        self.escrow.get_manifest_url(escrow_address)
+        result = self.escrow.get_manifest_url(escrow_address)
+
+        self.escrow._get_escrow_contract.assert_called_once_with(escrow_address)
+        mock_contract.functions.manifestUrl.assert_called_once_with()
+        self.assertEqual(result, "mock_value")
+
+    def test_get_manifest_url_not_memoized_before_setup(self):
+        mock_contract = MagicMock()
+        mock_contract.functions.manifestUrl = MagicMock()
+        mock_contract.functions.manifestUrl.return_value.call.side_effect = [
+            "",
+            "mock_value",
+        ]
+        self.escrow._get_escrow_contract = MagicMock(return_value=mock_contract)
+        escrow_address = "0x1234567890123456789012345678901234567890"
+
+        self.assertEqual(self.escrow.get_manifest_url(escrow_address), "")
+        self.assertEqual(self.escrow.get_manifest_url(escrow_address), "mock_value")
+
+    def test_get_manifest_url_not_memoized_after_abort(self):
+        mock_contract = MagicMock()
+        mock_contract.functions.manifestUrl = MagicMock()
+        mock_contract.functions.manifestUrl.return_value.call.return_value = (
+            "mock_value"
+        )
+        self.escrow._get_escrow_contract = MagicMock(return_value=mock_contract)
+        escrow_address = "0x1234567890123456789012345678901234567890"
+
+        self.escrow.get_manifest_url(escrow_address)
+        with patch("human_protocol_sdk.escrow.escrow_client.handle_transaction"):
+            self.escrow.abort(escrow_address)
+        self.escrow.get_manifest_url(escrow_address)
+
+        self.assertEqual(mock_contract.functions.manifestUrl.call_count, 2)
+
     def test_get_manifest_url_invalid_address(self):
         with self.assertRaises(EscrowClientError) as cm:
             self.escrow.get_manifest_url("invalid_address")
@@ -1999,6 +2175,19 @@ class TestEscrowClient(unittest.TestCase):
             "Escrow address is not provided by the factory", str(cm.exception)
         )
 
+    def test_get_escrow_contract_cached(self):
+        escrow_address = "0x62dD51230A30401C455c8398d06F85e4EaB6309f"
+        mock_has_escrow = MagicMock(return_value=True)
+        self.escrow.factory_contract.functions.hasEscrow = mock_has_escrow
+
+        escrow_contract = self.escrow._get_escrow_contract(escrow_address)
+
+        self.assertIs(
+            self.escrow._get_escrow_contract(escrow_address.lower()),
+            escrow_contract,
+        )
+        mock_has_escrow.assert_called_once_with(escrow_address)
+
     def test_get_results_url(self):
         mock_contract = MagicMock()
         mock_contract.functions.finalResultsUrl = MagicMock()
@@ -2048,6 +2237,22 @@ class TestEscrowClient(unittest.TestCase):
             "Escrow address is not provided by the factory", str(cm.exception)
         )
 
+    def test_get_results_url_after_complete(self):
+        mock_contract = MagicMock()
+        mock_contract.functions.finalResultsUrl = MagicMock()
+        mock_contract.functions.finalResultsUrl.return_value.call.return_value = (
+            "mock_value"
+        )
+        self.escrow._get_escrow_contract = MagicMock(return_value=mock_contract)
+        escrow_address = "0x1234567890123456789012345678901234567890"
+
+        with patch("human_protocol_sdk.escrow.escrow_client.handle_transaction"):
+            self.escrow.complete(escrow_address)
+        self.assertEqual(self.escrow.get_results_url(escrow_address), "mock_value")
+        self.assertEqual(self.escrow.get_results_url(escrow_address), "mock_value")
+
+        mock_contract.functions.finalResultsUrl.assert_called_once_with()
+
     def test_get_intermediate_results_url(self):
         mock_contract = MagicMock()
         mock_contract.functions.intermediateResultsUrl = MagicMock()
@@ -2163,6 +2368,59 @@ class TestEscrowClient(unittest.TestCase):
         mock_contract.functions.status.assert_called_once_with()
         self.assertEqual(result, Status.Launched)
 
+    def test_get_status_terminal_is_frozen(self):
+        mock_contract = MagicMock()
+        mock_contract.functions.status.return_value.call.return_value = (
+            Status.Cancelled.value
+        )
+        self.escrow._get_escrow_contract = MagicMock(return_value=mock_contract)
+        escrow_address = "0x1234567890123456789012345678901234567890"
+
+        self.assertEqual(self.escrow.get_status(escrow_address), Status.Cancelled)
+        self.assertEqual(self.escrow.get_status(escrow_address), Status.Cancelled)
+
+        mock_contract.functions.status.assert_called_once_with()
+
+    def test_get_status_paid_is_not_frozen(self):
+        mock_contract = MagicMock()
+        mock_contract.functions.status.return_value.call.return_value = (
+            Status.Paid.value
+        )
+        self.escrow._get_escrow_contract = MagicMock(return_value=mock_contract)
+        escrow_address = "0x1234567890123456789012345678901234567890"
+
+        self.escrow.get_status(escrow_address)
+        self.escrow.get_status(escrow_address)
+
+        self.assertEqual(mock_contract.functions.status.call_count, 2)
+
+    def test_get_status_after_complete(self):
+        mock_contract = MagicMock()
+        self.escrow._get_escrow_contract = MagicMock(return_value=mock_contract)
+        escrow_address = "0x1234567890123456789012345678901234567890"
+
+        with patch("human_protocol_sdk.escrow.escrow_client.handle_transaction"):
+            self.escrow.complete(escrow_address)
+
+        self.assertEqual(self.escrow.get_status(escrow_address), Status.Complete)
+        mock_contract.functions.status.assert_not_called()
+
+    def test_get_status_after_abort(self):
+        mock_contract = MagicMock()
+        mock_contract.functions.status.return_value.call.return_value = (
+            Status.Launched.value
+        )
+        self.escrow._get_escrow_contract = MagicMock(return_value=mock_contract)
+        escrow_address = "0x1234567890123456789012345678901234567890"
+
+        self.escrow._final_statuses[escrow_address.lower()] = Status.Cancelled
+
+        with patch("human_protocol_sdk.escrow.escrow_client.handle_transaction"):
+            self.escrow.abort(escrow_address)
+
+        self.assertEqual(self.escrow.get_status(escrow_address), Status.Launched)
+        mock_contract.functions.status.assert_called_once_with()
+
     def test_get_status_invalid_address(self):
         with self.assertRaises(EscrowClientError) as cm:
             self.escrow.get_status("invalid_address")
@@ -2467,6 +2725,79 @@ class TestEscrowClient(unittest.TestCase):
             "Escrow address is not provided by the factory", str(cm.exception)
         )
 
+    def test_is_trusted_handler(self):
+        mock_contract = MagicMock()
+        mock_contract.functions.areTrustedHandlers = MagicMock()
+        mock_contract.functions.areTrustedHandlers.return_value.call.return_value = True
+        self.escrow._get_escrow_contract = MagicMock(return_value=mock_contract)
+        escrow_address = "0x1234567890123456789012345678901234567890"
+        handler = "0x1234567890123456789012345678901234567891"
+
+        self.assertTrue(self.escrow.is_trusted_handler(escrow_address, handler))
+        self.assertTrue(self.escrow.is_trusted_handler(escrow_address, handler))
+
+        mock_contract.functions.areTrustedHandlers.assert_called_once_with(handler)
+
+    def test_is_trusted_handler_not_trusted(self):
+        mock_contract = MagicMock()
+        mock_contract.functions.areTrustedHandlers = MagicMock()
+        mock_contract.functions.areTrustedHandlers.return_value.call.return_value = (
+            False
+        )
+        self.escrow._get_escrow_contract = MagicMock(return_value=mock_contract)
+        escrow_address = "0x1234567890123456789012345678901234567890"
+        handler = "0x1234567890123456789012345678901234567891"
+
+        self.assertFalse(self.escrow.is_trusted_handler(escrow_address, handler))
+        self.assertFalse(self.escrow.is_trusted_handler(escrow_address, handler))
+
+        self.assertEqual(mock_contract.functions.areTrustedHandlers.call_count, 2)
+        self.assertEqual(self.escrow._trusted_handlers, {})
+
+    def test_abort_clears_escrow_caches(self):
+        mock_contract = MagicMock()
+        mock_contract.functions.manifestUrl.return_value.call.return_value = (
+            "mock_value"
+        )
+        mock_contract.functions.areTrustedHandlers.return_value.call.return_value = (
+            False
+        )
+        escrow_address = "0x1234567890123456789012345678901234567890"
+        handler = "0x1234567890123456789012345678901234567891"
+        self.escrow._escrow_contracts[escrow_address.lower()] = mock_contract
+
+        with patch("human_protocol_sdk.escrow.escrow_client.handle_transaction"):
+            self.escrow.add_trusted_handlers(escrow_address, [handler])
+            self.escrow.get_manifest_url(escrow_address)
+            self.escrow.abort(escrow_address)
+
+        self.assertEqual(self.escrow._trusted_handlers, {})
+        self.assertEqual(self.escrow._escrow_contracts, {})
+        self.assertEqual(self.escrow._immutable_views, {})
+
+        self.escrow._get_escrow_contract = MagicMock(return_value=mock_contract)
+        self.assertFalse(self.escrow.is_trusted_handler(escrow_address, handler))
+        mock_contract.functions.areTrustedHandlers.assert_called_once_with(handler)
+
+    def test_is_trusted_handler_after_add_trusted_handlers(self):
+        mock_contract = MagicMock()
+        self.escrow._get_escrow_contract = MagicMock(return_value=mock_contract)
+        escrow_address = "0x1234567890123456789012345678901234567890"
+        handler = "0x1234567890123456789012345678901234567891"
+
+        with patch("human_protocol_sdk.escrow.escrow_client.handle_transaction"):
+            self.escrow.add_trusted_handlers(escrow_address, [handler])
+
+        self.assertTrue(self.escrow.is_trusted_handler(escrow_address, handler))
+        mock_contract.functions.areTrustedHandlers.assert_not_called()
+
+    def test_is_trusted_handler_invalid_handler(self):
+        with self.assertRaises(EscrowClientError) as cm:
+            self.escrow.is_trusted_handler(
+                "0x1234567890123456789012345678901234567890", "invalid_address"
+            )
+        self.assertEqual(f"Invalid handler address: invalid_address", str(cm.exception))
+
     def test_get_factory_address(self):
         mock_contract = MagicMock()
         mock_contract.functions.escrowFactory = MagicMock()
@@ -531,6 +531,28 @@ class TestStakingClient(unittest.TestCase):
 
         self.assertIsNone(allocation)
 
+    def test_is_valid_escrow_cached(self):
+        escrow_address = "0x1234567890123456789012345678901234567890"
+        mock_function = MagicMock()
+        mock_function.return_value.call.return_value = True
+        self.staking_client.factory_contract.functions.hasEscrow = mock_function
+
+        self.assertTrue(self.staking_client._is_valid_escrow(escrow_address))
+        self.assertTrue(self.staking_client._is_valid_escrow(escrow_address))
+
+        mock_function.assert_called_once_with(escrow_address)
+
+    def test_is_valid_escrow_not_cached_when_invalid(self):
+        escrow_address = "0x1234567890123456789012345678901234567890"
+        mock_function = MagicMock()
+        mock_function.return_value.call.return_value = False
+        self.staking_client.factory_contract.functions.hasEscrow = mock_function
+
+        self.assertFalse(self.staking_client._is_valid_escrow(escrow_address))
+        self.assertFalse(self.staking_client._is_valid_escrow(escrow_address))
+
+        self.assertEqual(mock_function.call_count, 2)
+
 
 if __name__ == "__main__":
     unittest.main(exit=True)
@@ -1,7 +1,26 @@
+import json
 import unittest
+from functools import partial
+from unittest.mock import MagicMock, patch
+
+import requests
 from validators.utils import ValidationFailure
+from web3 import HTTPProvider, IPCProvider, Web3
+from web3.contract.contract import ContractFunction
+from web3.exceptions import ContractLogicError
+from web3.providers import BaseProvider
 
-from human_protocol_sdk.utils import validate_url
+from human_protocol_sdk.escrow import EscrowClientError
+from human_protocol_sdk.utils import (
+    _is_address,
+    batch_call,
+    get_escrow_interface,
+    handle_transaction,
+    is_address,
+    parse_transfer_transaction,
+    validate_url,
+    with_retry,
+)
 
 
 class TestStorageClient(unittest.TestCase):
@@ -13,3 +32,298 @@ class TestStorageClient(unittest.TestCase):
 
     def test_validate_url_with_invalid_url(self):
         assert isinstance(validate_url("htt://test:8000/valid"), ValidationFailure)
+
+    def test_is_address(self):
+        self.assertTrue(is_address("0x62dD51230A30401C455c8398d06F85e4EaB6309f"))
+        self.assertFalse(is_address("0x62dd51230A30401C455c8398d06F85e4EaB6309f"))
+        self.assertFalse(is_address("invalid_address"))
+        self.assertFalse(is_address(None))
+
+    def test_is_address_cached(self):
+        _is_address.cache_clear()
+        address = "0x62dD51230A30401C455c8398d06F85e4EaB6309f"
+
+        with patch(
+            "human_protocol_sdk.utils.Web3.is_address", return_value=True
+        ) as mock_is_address:
+            self.assertTrue(is_address(address))
+            self.assertTrue(is_address(address))
+
+        mock_is_address.assert_called_once_with(address)
+        self.assertEqual(_is_address.cache_info().hits, 1)
+
+    def test_get_escrow_interface_parsed_once(self):
+        self.assertIs(get_escrow_interface(), get_escrow_interface())
+
+
+class TestParseTransferTransaction(unittest.TestCase):
+    def test_parse_transfer_transaction_without_transfer_logs(self):
+        hmtoken_contract = MagicMock()
+        tx_receipt = {"logs": [{"topics": [Web3.keccak(text="Other()")]}]}
+
+        self.assertEqual(
+            parse_transfer_transaction(hmtoken_contract, tx_receipt), (False, None)
+        )
+        hmtoken_contract.events.Transfer.assert_not_called()
+
+    def test_parse_transfer_transaction(self):
+        hmtoken_contract = MagicMock()
+        hmtoken_contract.events.Transfer.return_value.process_receipt.return_value = [
+            {"args": {"_value": 10}}
+        ]
+        tx_receipt = {
+            "logs": [
+                {"topics": [Web3.keccak(text="Transfer(address,address,uint256)")]}
+            ]
+        }
+
+        self.assertEqual(
+            parse_transfer_transaction(hmtoken_contract, tx_receipt), (True, 10)
+        )
+
+
+class TestWithRetry(unittest.TestCase):
+    def test_with_retry_backoff(self):
+        fn = MagicMock(side_effect=[Exception("429"), Exception("429"), "ok"])
+        with patch("human_protocol_sdk.utils.time.sleep") as mock_sleep, patch(
+            "human_protocol_sdk.utils.random.uniform", return_value=0.5
+        ):
+            self.assertEqual(
+                with_retry(fn, retries=3, delay=1, backoff=4, max_delay=3), "ok"
+            )
+        self.assertEqual(
+            [call.args[0] for call in mock_sleep.call_args_list], [1.5, 3.5]
+        )
+
+    def test_with_retry_exhausted(self):
+        fn = MagicMock(side_effect=Exception("timeout"))
+        with patch("human_protocol_sdk.utils.time.sleep"):
+            self.assertFalse(with_retry(fn, retries=2))
+        self.assertEqual(fn.call_count, 2)
+
+    def test_with_retry_does_not_retry_handle_transaction_revert(self):
+        w3 = MagicMock()
+        tx = MagicMock()
+        tx.estimate_gas.side_effect = ContractLogicError("execution reverted: error")
+        fn = partial(handle_transaction, w3, "Complete", tx, EscrowClientError, None)
+
+        with patch("human_protocol_sdk.utils.time.sleep") as mock_sleep:
+            self.assertFalse(with_retry(fn))
+
+        tx.estimate_gas.assert_called_once_with()
+        tx.transact.assert_not_called()
+        mock_sleep.assert_not_called()
+
+    def test_with_retry_retries_handle_transaction_failure(self):
+        w3 = MagicMock()
+        tx = MagicMock()
+        tx.estimate_gas.return_value = 100
+        tx.transact.side_effect = Exception("429 Too Many Requests")
+        fn = partial(handle_transaction, w3, "Complete", tx, EscrowClientError, None)
+
+        with patch("human_protocol_sdk.utils.time.sleep"):
+            self.assertFalse(with_retry(fn, retries=3))
+
+        self.assertEqual(tx.transact.call_count, 3)
+
+    def test_with_retry_does_not_retry_revert(self):
+        fn = MagicMock(side_effect=ContractLogicError("reverted"))
+        with patch("human_protocol_sdk.utils.time.sleep") as mock_sleep:
+            self.assertFalse(with_retry(fn))
+        fn.assert_called_once()
+        mock_sleep.assert_not_called()
+
+
+class TestBatchCall(unittest.TestCase):
+    def setUp(self):
+        self.w3 = Web3(HTTPProvider("http://localhost:8545"))
+        self.escrow_contract = self.w3.eth.contract(
+            address="0x1234567890123456789012345678901234567890",
+            abi=get_escrow_interface()["abi"],
+        )
+
+    def test_batch_call(self):
+        response = [
+            {
+                "jsonrpc": "2.0",
+                "id": 1,
+                "result": "0x" + self.w3.codec.encode(["string"], ["url"]).hex(),
+            },
+            {
+                "jsonrpc": "2.0",
+                "id": 0,
+                "result": "0x" + self.w3.codec.encode(["uint8"], [1]).hex(),
+            },
+        ]
+        with patch(
+            "human_protocol_sdk.utils.make_post_request",
+            return_value=json.dumps(response).encode(),
+        ) as mock_post:
+            result = batch_call(
+                self.w3,
+                [
+                    self.escrow_contract.functions.status(),
+                    self.escrow_contract.functions.manifestUrl(),
+                ],
+                EscrowClientError,
+            )
+
+        mock_post.assert_called_once()
+        payload = json.loads(mock_post.call_args.args[1])
+        self.assertEqual([call["method"] for call in payload], ["eth_call"] * 2)
+        self.assertEqual(result, [1, "url"])
+
+    def test_batch_call_sends_from_and_block(self):
+        self.w3.eth.default_account = "0x1234567890123456789012345678901234567891"
+        response = [
+            {
+                "jsonrpc": "2.0",
+                "id": 0,
+                "result": "0x" + self.w3.codec.encode(["uint8"], [1]).hex(),
+            }
+        ]
+        with patch(
+            "human_protocol_sdk.utils.make_post_request",
+            return_value=json.dumps(response).encode(),
+        ) as mock_post:
+            batch_call(
+                self.w3,
+                [self.escrow_contract.functions.status()],
+                EscrowClientError,
+                block_identifier=10,
+            )
+
+        payload = json.loads(mock_post.call_args.args[1])
+        self.assertEqual(
+            payload[0]["params"][0]["from"],
+            "0x1234567890123456789012345678901234567891",
+        )
+        self.assertEqual(payload[0]["params"][1], "0xa")
+
+    def test_batch_call_error(self):
+        response = [{"jsonrpc": "2.0", "id": 0, "error": {"message": "reverted"}}]
+        with patch(
+            "human_protocol_sdk.utils.make_post_request",
+            return_value=json.dumps(response).encode(),
+        ):
+            with self.assertRaises(EscrowClientError) as cm:
+                batch_call(
+                    self.w3,
+                    [self.escrow_contract.functions.status()],
+                    EscrowClientError,
+                )
+        self.assertEqual("status call failed: reverted", str(cm.exception))
+
+    def test_batch_call_missing_response(self):
+        response = [
+            {
+                "jsonrpc": "2.0",
+                "id": 0,
+                "result": "0x" + self.w3.codec.encode(["uint8"], [1]).hex(),
+            }
+        ]
+        with patch(
+            "human_protocol_sdk.utils.make_post_request",
+            return_value=json.dumps(response).encode(),
+        ):
+            with self.assertRaises(EscrowClientError) as cm:
+                batch_call(
+                    self.w3,
+                    [
+                        self.escrow_contract.functions.status(),
+                        self.escrow_contract.functions.manifestUrl(),
+                    ],
+                    EscrowClientError,
+                )
+        self.assertEqual(
+            "Batch call failed: no response for manifestUrl", str(cm.exception)
+        )
+
+    def test_batch_call_rejected_batch(self):
+        response = {"jsonrpc": "2.0", "id": None, "error": {"message": "too large"}}
+        with patch(
+            "human_protocol_sdk.utils.make_post_request",
+            return_value=json.dumps(response).encode(),
+        ), patch.object(ContractFunction, "call", return_value=1) as mock_call:
+            result = batch_call(
+                self.w3,
+                [
+                    self.escrow_contract.functions.status(),
+                    self.escrow_contract.functions.status(),
+                ],
+                EscrowClientError,
+            )
+
+        self.assertEqual(mock_call.call_count, 2)
+        self.assertEqual(result, [1, 1])
+
+    def test_batch_call_rejected_http_status(self):
+        with patch(
+            "human_protocol_sdk.utils.make_post_request",
+            side_effect=requests.HTTPError("413 Payload Too Large"),
+        ), patch.object(ContractFunction, "call", return_value=1) as mock_call:
+            result = batch_call(
+                self.w3, [self.escrow_contract.functions.status()], EscrowClientError
+            )
+
+        mock_call.assert_called_once_with(block_identifier="latest")
+        self.assertEqual(result, [1])
+
+    def test_batch_call_unsupported_web3_version(self):
+        with patch("human_protocol_sdk.utils.BATCH_CALL_SUPPORTED", False), patch(
+            "human_protocol_sdk.utils.make_post_request"
+        ) as mock_post, patch.object(
+            ContractFunction, "call", return_value=1
+        ) as mock_call:
+            result = batch_call(
+                self.w3, [self.escrow_contract.functions.status()], EscrowClientError
+            )
+
+        mock_post.assert_not_called()
+        mock_call.assert_called_once_with(block_identifier="latest")
+        self.assertEqual(result, [1])
+
+    def test_batch_call_without_http_provider(self):
+        w3 = Web3(MagicMock(spec=IPCProvider))
+        mock_call = MagicMock()
+        mock_call.call.return_value = "mock_value"
+
+        with patch("human_protocol_sdk.utils.make_post_request") as mock_post:
+            result = batch_call(w3, [mock_call], EscrowClientError)
+
+        mock_post.assert_not_called()
+        self.assertEqual(result, ["mock_value"])
+
+    def test_batch_call_fallback_runs_middlewares(self):
+        class StubProvider(BaseProvider):
+            def make_request(self, method, params):
+                return {
+                    "jsonrpc": "2.0",
+                    "id": 0,
+                    "result": "0x" + Web3().codec.encode(["uint8"], [1]).hex(),
+                }
+
+        seen_methods = []
+
+        def recording_middleware(make_request, w3):
+            def middleware(method, params):
+                seen_methods.append(method)
+                return make_request(method, params)
+
+            return middleware
+
+        w3 = Web3(StubProvider())
+        w3.middleware_onion.add(recording_middleware, "recording")
+        escrow_contract = w3.eth.contract(
+            address="0x1234567890123456789012345678901234567890",
+            abi=get_escrow_interface()["abi"],
+        )
+
+        with patch("human_protocol_sdk.utils.make_post_request") as mock_post:
+            result = batch_call(
+                w3, [escrow_contract.functions.status()], EscrowClientError
+            )
+
+        mock_post.assert_not_called()
+        self.assertIn("eth_call", seen_methods)
+        self.assertEqual(result, [1])